@@ -43,6 +43,7 @@ Advanced Usage:
 """
 
 from .task_queue import TaskQueue, SearchTask, TaskStatus
+from .state_backend import StateBackend, FileStateBackend, MemoryStateBackend
 from .worker import WorkerPool, Worker
 from .progress import ProgressTracker, QueueStats
 from .manager import SearchQueueManager
@@ -54,6 +55,9 @@ __all__ = [
     "TaskQueue",
     "SearchTask",
     "TaskStatus",
+    "StateBackend",
+    "FileStateBackend",
+    "MemoryStateBackend",
     "WorkerPool",
     "Worker",
     "ProgressTracker",
@@ -2,18 +2,20 @@
 
 import asyncio
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from datetime import date
 
 from .task_queue import TaskQueue, SearchTask, TaskStatus
 from .worker import WorkerPool
 from .progress import ProgressTracker
 from ..search.orchestrator import SearchOrchestrator
-from ..search.strategy import SearchStrategy
 from ..io.cache import SearchCache
 from ..core.models import Paper
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from ..search.strategy import SearchStrategy
+
 logger = get_logger(__name__)
 
 
@@ -58,7 +60,7 @@ class SearchQueueManager:
         self,
         num_workers: int = 3,
         cache_dir: Optional[Path] = None,
-        strategy: Optional[SearchStrategy] = None,
+        strategy: Optional["SearchStrategy"] = None,
     ):
         """
         Initialize manager.
@@ -88,6 +90,9 @@ class SearchQueueManager:
         self.progress = ProgressTracker(self.queue)
         
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Restore persisted tasks now so the sync getters see them
+        self._run_sync(self.queue.load())
         logger.info(
             f"SearchQueueManager initialized with {num_workers} workers"
         )
@@ -117,7 +122,9 @@ class SearchQueueManager:
             resume_from_cache: Resume from cached results if available
             
         Returns:
-            task_id: Unique ID for tracking this search
+            task_id: ID for tracking this search. If an identical search
+                (same source, query, dates, limit and config) is already
+                pending or running, its existing ID is returned instead.
             
         Example:
             >>> manager = SearchQueueManager()
@@ -148,8 +155,8 @@ class SearchQueueManager:
             end_date=end_date.isoformat() if end_date else None,
         )
         
-        # Enqueue (use run_sync helper)
-        task_id = self._run_sync(self.queue.enqueue(task))
+        # Enqueue and persist before returning (use run_sync helper)
+        task_id = self._run_sync(self._persist(self.queue.enqueue(task)))
         
         logger.info(
             f"Added search: {source} query='{query[:50]}...' "
@@ -229,6 +236,9 @@ class SearchQueueManager:
             
             # Stop workers
             await self.worker_pool.stop()
+            
+            # Persist final task states
+            await self.queue.flush()
         
         # Run event loop
         self._run_sync(_run())
@@ -242,11 +252,14 @@ class SearchQueueManager:
         """
         Get results for a completed task.
         
+        Papers are read back from the queue's state backend on each call.
+        
         Args:
             task_id: Task ID from add_search()
             
         Returns:
-            List of papers or None if not completed
+            List of papers, or None if not completed or the stored papers
+            are missing
             
         Example:
             >>> task_id = manager.add_search("openalex", "AI", limit=100)
@@ -265,12 +278,14 @@ class SearchQueueManager:
             )
             return None
         
-        return task.papers
+        return self._run_sync(self.queue.load_papers(task_id))
     
     def get_all_results(self) -> Dict[str, List[Paper]]:
         """
         Get results from all completed tasks.
         
+        Tasks whose stored papers are missing are left out.
+        
         Returns:
             Dict mapping task_id -> papers
             
@@ -285,7 +300,9 @@ class SearchQueueManager:
         results = {}
         for task in self.queue.get_all_tasks():
             if task.status in (TaskStatus.COMPLETED, TaskStatus.CACHED):
-                results[task.task_id] = task.papers
+                papers = self._run_sync(self.queue.load_papers(task.task_id))
+                if papers is not None:
+                    results[task.task_id] = papers
         return results
     
     def get_task_status(self, task_id: str) -> Optional[str]:
@@ -314,7 +331,7 @@ class SearchQueueManager:
             >>> # Changed mind
             >>> manager.cancel_task(task_id)
         """
-        self._run_sync(self.queue.cancel_task(task_id))
+        self._run_sync(self._persist(self.queue.cancel_task(task_id)))
         logger.info(f"Cancelled task {task_id[:8]}")
     
     def get_queue_size(self) -> int:
@@ -326,6 +343,18 @@ class SearchQueueManager:
         """
         return self._run_sync(self.queue.size())
     
+    async def _persist(self, coro):
+        """
+        Await a queue mutation, then write it to the state backend.
+        
+        The queue's background flusher only runs while the loop does, and
+        the loop only runs inside ``_run_sync``, so each sync mutation
+        flushes before returning.
+        """
+        result = await coro
+        await self.queue.flush()
+        return result
+    
     def _run_sync(self, coro):
         """
         Helper to run async code synchronously.
@@ -345,5 +374,6 @@ class SearchQueueManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit with cleanup."""
         if self._loop and not self._loop.is_closed():
+            self._loop.run_until_complete(self.queue.aclose())
             self._loop.close()
         self.cache.close()
@@ -112,15 +112,16 @@ class ProgressTracker:
     def compute_stats(self) -> QueueStats:
         """Compute current queue statistics."""
         tasks = self.queue.get_all_tasks()
+        by_status = self.queue.get_tasks_by_status
         
         stats = QueueStats(
             total_tasks=len(tasks),
-            pending=len([t for t in tasks if t.status == TaskStatus.PENDING]),
-            running=len([t for t in tasks if t.status == TaskStatus.RUNNING]),
-            completed=len([t for t in tasks if t.status == TaskStatus.COMPLETED]),
-            failed=len([t for t in tasks if t.status == TaskStatus.FAILED]),
-            cached=len([t for t in tasks if t.status == TaskStatus.CACHED]),
-            cancelled=len([t for t in tasks if t.status == TaskStatus.CANCELLED]),
+            pending=len(by_status(TaskStatus.PENDING)),
+            running=len(by_status(TaskStatus.RUNNING)),
+            completed=len(by_status(TaskStatus.COMPLETED)),
+            failed=len(by_status(TaskStatus.FAILED)),
+            cached=len(by_status(TaskStatus.CACHED)),
+            cancelled=len(by_status(TaskStatus.CANCELLED)),
             total_papers=sum(t.papers_fetched for t in tasks),
             total_pages=sum(t.pages_fetched for t in tasks),
             started_at=self.started_at or datetime.now(),
@@ -0,0 +1,197 @@
+"""Storage backends for task queue persistence."""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiofiles
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# Encoder/decoder for persisted queue records (msgspec is much faster when
+# installed). Both raise TypeError for values they can't serialize.
+if HAS_MSGSPEC:
+    encode_record = msgspec.json.Encoder().encode
+    _decode_record = msgspec.json.Decoder().decode
+else:
+    def encode_record(record: Dict[str, Any]) -> bytes:
+        return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+    _decode_record = json.loads
+
+
+class StateBackend(ABC):
+    """
+    Storage for a task queue's snapshot, write-ahead log and result artifacts.
+
+    The queue appends small event records to the log as tasks change and
+    periodically replaces the snapshot, after which the log is truncated.
+    Papers fetched by completed tasks are stored as separate artifacts so
+    the queue state only holds their location.
+    """
+
+    @abstractmethod
+    async def load(self) -> Dict[str, Any]:
+        """
+        Read persisted state.
+
+        Returns:
+            ``{"snapshot": dict or None, "events": [event, ...]}``
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        """Replace the snapshot and truncate the log."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def append(self, records: List[bytes]) -> None:
+        """Append events, already encoded with ``encode_record``, to the log."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_artifact(self, name: str, data: bytes) -> str:
+        """
+        Store a result artifact.
+
+        Returns:
+            Location to pass to ``load_artifact``
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def load_artifact(self, location: str) -> bytes:
+        """
+        Read an artifact stored by ``save_artifact``.
+
+        Raises:
+            FileNotFoundError: If nothing is stored at ``location``
+        """
+        raise NotImplementedError
+
+
+class FileStateBackend(StateBackend):
+    """
+    Snapshot file plus an append-only JSON-lines log next to it.
+
+    Artifacts go in a ``<stem>_artifacts`` directory beside the snapshot.
+
+    Example:
+        >>> backend = FileStateBackend(Path(".cache/task_queue_state.json"))
+        >>> backend.wal_path
+        PosixPath('.cache/task_queue_state.wal')
+    """
+
+    def __init__(self, path: Path, artifacts_dir: Optional[Path] = None):
+        """
+        Initialize file backend.
+
+        Args:
+            path: Snapshot file; the log is written alongside with a .wal suffix
+            artifacts_dir: Directory for result artifacts
+                (default: ``<stem>_artifacts`` next to ``path``)
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.wal_path = self.path.with_suffix(".wal")
+        self.artifacts_dir = artifacts_dir or self.path.with_name(
+            f"{self.path.stem}_artifacts"
+        )
+
+    async def load(self) -> Dict[str, Any]:
+        snapshot: Optional[Dict[str, Any]] = None
+        if self.path.exists():
+            async with aiofiles.open(self.path, "rb") as f:
+                snapshot = _decode_record(await f.read())
+
+        events: List[Dict[str, Any]] = []
+        if self.wal_path.exists():
+            async with aiofiles.open(self.wal_path, "rb") as f:
+                data = await f.read()
+            for line in data.splitlines():
+                try:
+                    events.append(_decode_record(line))
+                except ValueError:
+                    # Torn line from a crash or failed append
+                    logger.warning("Ignoring truncated queue log entry")
+
+        return {"snapshot": snapshot, "events": events}
+
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        # Write to a temp file and swap so a crash never leaves a torn file
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(encode_record(snapshot))
+        os.replace(tmp_path, self.path)
+
+        # Events already in the snapshot are skipped on replay, so a crash
+        # before this truncate is harmless
+        async with aiofiles.open(self.wal_path, "wb"):
+            pass
+
+    async def append(self, records: List[bytes]) -> None:
+        data = b"".join(record + b"\n" for record in records)
+        async with aiofiles.open(self.wal_path, "ab") as f:
+            await f.write(data)
+
+    async def save_artifact(self, name: str, data: bytes) -> str:
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        path = self.artifacts_dir / name
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+        return str(path)
+
+    async def load_artifact(self, location: str) -> bytes:
+        async with aiofiles.open(location, "rb") as f:
+            return await f.read()
+
+
+class MemoryStateBackend(StateBackend):
+    """
+    In-process backend with no filesystem access.
+
+    Records are stored encoded, exactly as the file backend would write
+    them, so a queue restored from it sees the same round-trip. Share one
+    instance between queues to simulate a restart.
+    """
+
+    def __init__(self):
+        """Initialize empty in-memory state."""
+        self.snapshot: Optional[bytes] = None
+        self.events: List[bytes] = []
+        self.artifacts: Dict[str, bytes] = {}
+
+    async def load(self) -> Dict[str, Any]:
+        return {
+            "snapshot": _decode_record(self.snapshot) if self.snapshot else None,
+            "events": [_decode_record(event) for event in self.events],
+        }
+
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        self.snapshot = encode_record(snapshot)
+        self.events = []
+
+    async def append(self, records: List[bytes]) -> None:
+        self.events.extend(records)
+
+    async def save_artifact(self, name: str, data: bytes) -> str:
+        self.artifacts[name] = data
+        return name
+
+    async def load_artifact(self, location: str) -> bytes:
+        try:
+            return self.artifacts[location]
+        except KeyError:
+            raise FileNotFoundError(location) from None
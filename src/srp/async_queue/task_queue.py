@@ -1,20 +1,24 @@
 """Core task queue with state management and persistence."""
 
 import asyncio
-import uuid
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from collections import deque
-import json
+from secrets import token_hex
+from typing import Optional, Dict, Any, List, Tuple
 
+from .state_backend import StateBackend, FileStateBackend, encode_record
 from ..utils.logging import get_logger
 from ..core.models import Paper
 
 logger = get_logger(__name__)
 
+# Upper bound on the flusher's backoff while writes keep failing
+MAX_FLUSH_RETRY_DELAY = 30.0
+
 
 class TaskStatus(Enum):
     """Task execution states."""
@@ -26,7 +30,7 @@ class TaskStatus(Enum):
     CACHED = "cached"  # Completed from cache
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchTask:
     """
     A single search task with all necessary metadata.
@@ -41,7 +45,7 @@ class SearchTask:
         config: Source-specific configuration
         priority: Execution priority (lower = higher priority)
         status: Current task status
-        papers: Collected papers
+        papers_path: Where the collected papers are stored (see TaskQueue.load_papers)
         error: Error message if failed
         retry_count: Number of retry attempts
         max_retries: Maximum retry attempts
@@ -50,7 +54,7 @@ class SearchTask:
     """
     
     # Identity
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=lambda: token_hex(8))
     
     # Search parameters
     source: str = ""
@@ -69,8 +73,8 @@ class SearchTask:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
-    # Results
-    papers: List[Paper] = field(default_factory=list)
+    # Results (papers are stored outside the task, only their location is kept)
+    papers_path: Optional[str] = None
     error: Optional[str] = None
     
     # Progress tracking
@@ -99,6 +103,7 @@ class SearchTask:
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "error": self.error,
+            "papers_path": self.papers_path,
             "pages_fetched": self.pages_fetched,
             "papers_fetched": self.papers_fetched,
             "retry_count": self.retry_count,
@@ -130,6 +135,7 @@ class SearchTask:
         if data.get("completed_at"):
             task.completed_at = datetime.fromisoformat(data["completed_at"])
         task.error = data.get("error")
+        task.papers_path = data.get("papers_path")
         task.pages_fetched = data.get("pages_fetched", 0)
         task.papers_fetched = data.get("papers_fetched", 0)
         return task
@@ -153,63 +159,152 @@ class TaskQueue:
         >>> task = await queue.dequeue()
         >>> # ... execute task ...
         >>> await queue.complete_task(task_id, papers)
+        >>> await queue.aclose()  # Write pending state
+    
+    Persisted state is read on the first async call (or an explicit
+    ``await queue.load()``); the sync getters only see loaded tasks.
+    
+    Only mutations take the lock. Reads (``size()``, ``get_task()``,
+    ``get_tasks_by_status()``) never await, so each one sees a consistent
+    state between two mutations, which may already be stale by the time
+    the caller acts on it.
     """
     
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        max_size: int = 0,
+        flush_delay: float = 0.1,
+        snapshot_every: int = 1000,
+        dedup: bool = True,
+        state_backend: Optional[StateBackend] = None,
+    ):
         """
         Initialize task queue.
         
+        Each state change is recorded as one event in an append-only
+        write-ahead log kept by the state backend. A background flusher
+        coalesces all changes made within ``flush_delay`` seconds into a
+        single append. Every ``snapshot_every`` events (and on ``aclose()``)
+        the full state is written as a snapshot and the log is truncated.
+        Call ``flush()`` to force a write, and ``aclose()`` on shutdown.
+        
         Args:
-            state_file: Path to state persistence file (default: .cache/task_queue_state.json)
+            state_file: Path to state snapshot file (default: .cache/task_queue_state.json)
+            max_size: Maximum number of pending tasks, 0 = unbounded
+            flush_delay: Seconds to coalesce state changes before writing
+            snapshot_every: Logged events between full snapshots
+            dedup: Return the existing task_id when an identical search
+                (source, query, dates, limit) is already pending or running
+            state_backend: Where state is persisted (default: FileStateBackend
+                on ``state_file``)
         """
-        self.state_file = state_file or Path(".cache/task_queue_state.json")
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.state_backend = state_backend or FileStateBackend(
+            state_file or Path(".cache/task_queue_state.json")
+        )
+        self.max_size = max_size
+        self.flush_delay = flush_delay
+        self.snapshot_every = snapshot_every
+        self.dedup = dedup
         
         # Task storage
         self.tasks: Dict[str, SearchTask] = {}
-        self.pending_queue: deque[str] = deque()  # task_ids
         self.running_tasks: Dict[str, SearchTask] = {}
         
-        # Load persisted state
-        self._load_state()
+        # task_ids per status in the order they entered it, kept in sync by
+        # _set_status() (dicts give O(1) moves and keep insertion order)
+        self._by_status: Dict[TaskStatus, Dict[str, None]] = {s: {} for s in TaskStatus}
+        
+        # Search fingerprint -> task_id of the live (pending/running) task
+        self._fingerprints: Dict[bytes, str] = {}
+        
+        # Heap of (priority, seq, task_id); seq keeps FIFO order within a priority.
+        # Cancelled tasks are left in the heap and skipped on dequeue, so the
+        # heap is unbounded and max_size is checked against pending tasks.
+        self._pq: asyncio.PriorityQueue[Tuple[int, int, str]] = asyncio.PriorityQueue()
+        self._seq = 0
+        
+        # Write-ahead log: last assigned event seq, unwritten encoded events,
+        # and events persisted since the last snapshot
+        self._wal_seq = 0
+        self._wal_buffer: List[bytes] = []
+        self._wal_events = 0
+        # Events the backend rejected with a non-I/O error; kept for
+        # inspection instead of being retried forever
+        self._rejected_events: List[bytes] = []
         
         # Synchronization
         self._lock = asyncio.Lock()
-        self._not_empty = asyncio.Condition(self._lock)
+        self._loaded = False
+        
+        # Persistence (flusher task starts on the first mutation)
+        self._dirty = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+    
+    def _next_entry(self, task: SearchTask) -> Tuple[int, int, str]:
+        """Build a heap entry for a task."""
+        self._seq += 1
+        return (task.priority, self._seq, task.task_id)
     
     async def enqueue(self, task: SearchTask) -> str:
         """
         Add task to queue.
         
         Tasks are sorted by priority (lower priority number = executes first).
+        With ``dedup`` on, an identical search that is still pending or
+        running is not queued again.
         
         Args:
             task: SearchTask to enqueue
             
         Returns:
-            task_id for tracking
+            task_id for tracking (the existing task's ID for duplicates)
+            
+        Raises:
+            ValueError: If ``max_size`` is set and the queue is full
+            TypeError: If the task can't be persisted (e.g. a ``config``
+                value the state encoder doesn't support)
         """
+        await self.load()
         async with self._lock:
-            self.tasks[task.task_id] = task
-            self.pending_queue.append(task.task_id)
+            # Nothing in here awaits, so concurrent enqueues never yield
+            # to each other while holding the lock
+            fingerprint = None
+            if self.dedup:
+                fingerprint = self._fingerprint(task)
+                existing_id = self._fingerprints.get(fingerprint)
+                if existing_id is not None:
+                    logger.info(
+                        f"Skipped duplicate of task {existing_id[:8]}: "
+                        f"{task.source} query='{task.query[:50]}...'"
+                    )
+                    return existing_id
             
-            # Sort queue by priority (lower priority = higher in queue)
-            self.pending_queue = deque(
-                sorted(
-                    self.pending_queue,
-                    key=lambda tid: self.tasks[tid].priority
-                )
-            )
+            if self.max_size and len(self._by_status[TaskStatus.PENDING]) >= self.max_size:
+                raise ValueError("Queue full")
+            
+            # Encode the event before touching any state so a task that
+            # can't be persisted is rejected here, not in the flusher
+            task_data = task.to_dict()
+            task_data["status"] = TaskStatus.PENDING.value
+            record = self._encode_event("enqueue", task_data)
+            
+            self._pq.put_nowait(self._next_entry(task))
+            
+            if fingerprint is not None:
+                self._fingerprints[fingerprint] = task.task_id
+            self.tasks[task.task_id] = task
+            self._set_status(task, TaskStatus.PENDING)
             
             logger.info(
                 f"Enqueued task {task.task_id[:8]}: "
                 f"{task.source} query='{task.query[:50]}...' priority={task.priority}"
             )
             
-            self._save_state()
-            self._not_empty.notify()
-            
-            return task.task_id
+            self._push_wal(record)
+        
+        return task.task_id
     
     async def dequeue(self, timeout: Optional[float] = None) -> Optional[SearchTask]:
         """
@@ -221,28 +316,41 @@ class TaskQueue:
         Returns:
             Task or None if timeout
         """
-        async with self._not_empty:
-            while not self.pending_queue:
+        await self.load()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        
+        while True:
+            try:
+                # Fast path: no future or timer when an entry is ready
+                _, _, task_id = self._pq.get_nowait()
+            except asyncio.QueueEmpty:
                 try:
-                    await asyncio.wait_for(
-                        self._not_empty.wait(),
-                        timeout=timeout
-                    )
+                    if deadline is None:
+                        _, _, task_id = await self._pq.get()
+                    else:
+                        remaining = max(0.0, deadline - loop.time())
+                        _, _, task_id = await asyncio.wait_for(
+                            self._pq.get(), timeout=remaining
+                        )
                 except asyncio.TimeoutError:
                     return None
             
-            task_id = self.pending_queue.popleft()
-            task = self.tasks[task_id]
-            
-            # Move to running
-            task.status = TaskStatus.RUNNING
-            task.started_at = datetime.now()
-            self.running_tasks[task_id] = task
-            
-            logger.debug(f"Dequeued task {task_id[:8]}")
-            self._save_state()
-            
-            return task
+            async with self._lock:
+                task = self.tasks.get(task_id)
+                if task is None or task.status != TaskStatus.PENDING:
+                    # Entry for a cancelled task
+                    continue
+                
+                # Move to running
+                self._set_status(task, TaskStatus.RUNNING)
+                task.started_at = datetime.now()
+                self.running_tasks[task_id] = task
+                
+                logger.debug(f"Dequeued task {task_id[:8]}")
+                self._append_wal("status", task)
+                
+                return task
     
     async def complete_task(
         self, 
@@ -253,20 +361,32 @@ class TaskQueue:
         """
         Mark task as completed.
         
+        The papers are written to the state backend as an artifact and
+        only their count and location are kept on the task; read them back
+        with ``load_papers()``.
+        
         Args:
             task_id: ID of completed task
             papers: Collected papers
             from_cache: Whether results came from cache
         """
+        await self.load()
+        if task_id not in self.tasks:
+            logger.warning(f"Task {task_id[:8]} not found")
+            return
+        
+        # Write outside the lock so other queue operations aren't held up
+        papers_path = None
+        if papers:
+            papers_path = await self.state_backend.save_artifact(
+                f"{task_id}.jsonl", self._encode_papers(papers)
+            )
+        
         async with self._lock:
-            if task_id not in self.tasks:
-                logger.warning(f"Task {task_id[:8]} not found")
-                return
-            
             task = self.tasks[task_id]
-            task.status = TaskStatus.CACHED if from_cache else TaskStatus.COMPLETED
+            self._set_status(task, TaskStatus.CACHED if from_cache else TaskStatus.COMPLETED)
             task.completed_at = datetime.now()
-            task.papers = papers
+            task.papers_path = papers_path
             task.papers_fetched = len(papers)
             
             if task_id in self.running_tasks:
@@ -277,7 +397,7 @@ class TaskQueue:
                 f"{len(papers)} papers ({task.status.value})"
             )
             
-            self._save_state()
+            self._append_wal("status", task)
     
     async def fail_task(self, task_id: str, error: str):
         """
@@ -287,6 +407,7 @@ class TaskQueue:
             task_id: ID of failed task
             error: Error message
         """
+        await self.load()
         async with self._lock:
             if task_id not in self.tasks:
                 return
@@ -299,25 +420,25 @@ class TaskQueue:
                 logger.warning(
                     f"Task {task_id[:8]} failed (retry {task.retry_count}/{task.max_retries}): {error}"
                 )
-                task.status = TaskStatus.PENDING
+                self._set_status(task, TaskStatus.PENDING)
                 task.error = error
-                self.pending_queue.append(task_id)
                 
                 # Lower priority for failed tasks (add penalty)
                 task.priority += 10
+                self._requeue(task)
             else:
                 # Max retries exceeded
                 logger.error(
                     f"Task {task_id[:8]} failed permanently after "
                     f"{task.retry_count} retries: {error}"
                 )
-                task.status = TaskStatus.FAILED
+                self._set_status(task, TaskStatus.FAILED)
                 task.error = error
             
             if task_id in self.running_tasks:
                 del self.running_tasks[task_id]
             
-            self._save_state()
+            self._append_wal("status", task)
     
     async def cancel_task(self, task_id: str):
         """
@@ -326,69 +447,246 @@ class TaskQueue:
         Args:
             task_id: ID of task to cancel
         """
+        await self.load()
         async with self._lock:
             if task_id not in self.tasks:
                 return
             
             task = self.tasks[task_id]
-            task.status = TaskStatus.CANCELLED
+            # A pending task's heap entry stays behind and is skipped on dequeue
+            self._set_status(task, TaskStatus.CANCELLED)
             
-            # Remove from queues
             if task_id in self.running_tasks:
                 del self.running_tasks[task_id]
-            if task_id in self.pending_queue:
-                self.pending_queue.remove(task_id)
             
             logger.info(f"Task {task_id[:8]} cancelled")
-            self._save_state()
+            self._append_wal("status", task)
     
     def get_task(self, task_id: str) -> Optional[SearchTask]:
         """Get task by ID."""
         return self.tasks.get(task_id)
     
+    async def load_papers(self, task_id: str) -> Optional[List[Paper]]:
+        """
+        Read the papers collected by a completed task.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            Papers (empty if the task found none), or None if the task is
+            unknown or its artifact is missing
+        """
+        await self.load()
+        task = self.tasks.get(task_id)
+        if task is None:
+            return None
+        if task.papers_path is None:
+            return []
+        try:
+            data = await self.state_backend.load_artifact(task.papers_path)
+        except FileNotFoundError:
+            logger.warning(
+                f"Papers for task {task_id[:8]} missing at {task.papers_path}"
+            )
+            return None
+        return [Paper.model_validate_json(line) for line in data.splitlines()]
+    
+    @staticmethod
+    def _encode_papers(papers: List[Paper]) -> bytes:
+        """Serialize papers as JSON lines."""
+        return b"".join(paper.model_dump_json().encode("utf-8") + b"\n" for paper in papers)
+    
     def get_all_tasks(self) -> List[SearchTask]:
         """Get all tasks."""
         return list(self.tasks.values())
     
     def get_tasks_by_status(self, status: TaskStatus) -> List[SearchTask]:
         """Get tasks with specific status."""
-        return [t for t in self.tasks.values() if t.status == status]
+        return [self.tasks[tid] for tid in self._by_status[status]]
     
     async def size(self) -> int:
         """Number of pending tasks."""
-        async with self._lock:
-            return len(self.pending_queue)
+        await self.load()
+        return len(self._by_status[TaskStatus.PENDING])
+    
+    def _set_status(self, task: SearchTask, status: TaskStatus):
+        """Change a task's status and keep the status index in sync."""
+        self._by_status[task.status].pop(task.task_id, None)
+        task.status = status
+        self._by_status[status][task.task_id] = None
+        
+        # Finished tasks no longer block an identical search from being queued
+        if self.dedup and status not in (TaskStatus.PENDING, TaskStatus.RUNNING):
+            fingerprint = self._fingerprint(task)
+            if self._fingerprints.get(fingerprint) == task.task_id:
+                del self._fingerprints[fingerprint]
+    
+    @staticmethod
+    def _fingerprint(task: SearchTask) -> bytes:
+        """Identity of a search for duplicate detection."""
+        # Config reaches the adapter, so it's part of what the search fetches
+        config = json.dumps(task.config, sort_keys=True, default=str)
+        key = f"{task.source}|{task.query}|{task.start_date}|{task.end_date}|{task.limit}|{config}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    
+    def _requeue(self, task: SearchTask):
+        """Push a task back onto the heap (unbounded, so this never blocks)."""
+        self._pq.put_nowait(self._next_entry(task))
+    
+    def _append_wal(self, op: str, task: SearchTask):
+        """
+        Record a task change in the write-ahead log.
+        
+        Events carry the full task record so replay is a plain overwrite:
+        ``{"seq": 7, "op": "enqueue" | "status", "task": {...}}``. They are
+        encoded here, so the caller sees any TypeError, then buffered and
+        appended to disk by the background flusher.
+        """
+        self._push_wal(self._encode_event(op, task.to_dict()))
+    
+    def _encode_event(self, op: str, task_data: Dict[str, Any]) -> bytes:
+        """Encode the next log event without consuming its seq."""
+        return encode_record({"seq": self._wal_seq + 1, "op": op, "task": task_data})
+    
+    def _push_wal(self, record: bytes):
+        """Buffer an event from ``_encode_event`` and schedule a write."""
+        self._wal_seq += 1
+        self._wal_buffer.append(record)
+        self._mark_dirty()
+    
+    def _mark_dirty(self):
+        """Schedule a write on the background flusher."""
+        self._dirty.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
     
-    def _save_state(self):
-        """Persist queue state to disk."""
+    async def _flush_loop(self):
+        """Background task: coalesce state changes and write them out."""
+        delay = self.flush_delay
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(delay)
+            try:
+                await self.flush()
+                delay = self.flush_delay
+            except OSError as e:
+                # flush() keeps the events buffered and marks the queue dirty,
+                # so back off (doubling, capped) instead of retrying every
+                # flush_delay. The buffer grows until a write succeeds; once
+                # it reaches snapshot_every the retry writes a snapshot.
+                delay = min(max(delay, 0.01) * 2, MAX_FLUSH_RETRY_DELAY)
+                logger.error(f"Failed to save queue state, retrying in {delay:.1f}s: {e}")
+            except Exception:
+                # flush() has set the batch aside; keep the flusher alive
+                logger.exception("Failed to save queue state")
+    
+    async def flush(self, snapshot: bool = False):
+        """
+        Write pending state changes to the backend now.
+        
+        Args:
+            snapshot: Write a full snapshot and truncate the log even if
+                ``snapshot_every`` has not been reached
+        """
+        async with self._flush_lock:
+            if not self._dirty.is_set() and not (snapshot and self._wal_events):
+                return
+            self._dirty.clear()
+            events, self._wal_buffer = self._wal_buffer, []
+            
+            try:
+                if snapshot or self._wal_events + len(events) >= self.snapshot_every:
+                    try:
+                        await self._write_snapshot()
+                    except TypeError as e:
+                        # A task was changed after it was logged into something
+                        # the encoder rejects; keep appending to the log instead
+                        logger.error(f"Skipped queue snapshot: {e}")
+                        await self._write_wal(events)
+                else:
+                    await self._write_wal(events)
+            except (OSError, asyncio.CancelledError):
+                # Keep the changes pending so the next flush retries them
+                self._wal_buffer[:0] = events
+                self._dirty.set()
+                raise
+            except Exception:
+                # Retrying won't fix this; set the batch aside so later
+                # changes are still persisted
+                self._rejected_events.extend(events)
+                logger.error(f"Set aside {len(events)} queue events that could not be saved")
+                raise
+    
+    async def _write_wal(self, events: List[bytes]):
+        """Append events to the log."""
+        await self.state_backend.append(events)
+        self._wal_events += len(events)
+    
+    async def _write_snapshot(self):
+        """Write the full state and truncate the log it supersedes."""
         state = {
+            "seq": self._wal_seq,
             "tasks": {tid: task.to_dict() for tid, task in self.tasks.items()},
-            "pending_queue": list(self.pending_queue),
             "saved_at": datetime.now().isoformat(),
         }
-        self.state_file.write_text(json.dumps(state, indent=2))
+        await self.state_backend.save(state)
+        self._wal_events = 0
+    
+    async def aclose(self):
+        """Stop the background flusher and write a final snapshot."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush(snapshot=True)
     
-    def _load_state(self):
-        """Load queue state from disk."""
-        if not self.state_file.exists():
+    async def load(self):
+        """Load persisted state (only the first call does any work)."""
+        if self._loaded:
             return
-        
+        async with self._lock:
+            if not self._loaded:
+                await self._load_state()
+                self._loaded = True
+    
+    async def _load_state(self):
+        """Load the last snapshot and replay the log on top of it."""
         try:
-            state = json.loads(self.state_file.read_text())
+            data = await self.state_backend.load()
             
-            # Restore tasks
-            for task_id, task_data in state["tasks"].items():
-                task = SearchTask.from_dict(task_data)
-                self.tasks[task_id] = task
-                
-                # Re-queue pending/running tasks
-                if task.status in (TaskStatus.PENDING, TaskStatus.RUNNING):
-                    task.status = TaskStatus.PENDING  # Reset running to pending
-                    self.pending_queue.append(task_id)
+            snapshot_seq = 0
+            if data["snapshot"]:
+                snapshot_seq = data["snapshot"].get("seq", 0)
+                for task_id, task_data in data["snapshot"]["tasks"].items():
+                    self.tasks[task_id] = SearchTask.from_dict(task_data)
+            self._wal_seq = snapshot_seq
             
+            # Events up to the snapshot's seq are already reflected in it
+            for event in data["events"]:
+                self._wal_events += 1
+                if event["seq"] <= snapshot_seq:
+                    continue
+                task = SearchTask.from_dict(event["task"])
+                self.tasks[task.task_id] = task
+                self._wal_seq = event["seq"]
+        except Exception as e:
+            logger.error(f"Failed to load queue state: {e}")
+        
+        # Build the status index and re-queue pending/running tasks
+        for task in self.tasks.values():
+            if task.status in (TaskStatus.PENDING, TaskStatus.RUNNING):
+                task.status = TaskStatus.PENDING  # Reset running to pending
+                self._requeue(task)
+                if self.dedup:
+                    self._fingerprints.setdefault(self._fingerprint(task), task.task_id)
+            self._by_status[task.status][task.task_id] = None
+        
+        if self.tasks:
             logger.info(
                 f"Restored {len(self.tasks)} tasks from state "
-                f"({len(self.pending_queue)} pending)"
+                f"({self._pq.qsize()} pending)"
             )
-        except Exception as e:
-            logger.error(f"Failed to load queue state: {e}")
@@ -1,7 +1,26 @@
 """ID normalization and generation utilities."""
 
 import hashlib
-from typing import Optional
+import string
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
+
+# Same DOIs/titles recur across sources; cache the hot set of normalizations
+_CACHE_SIZE = 131072
+
+# Lowercase DOI prefixes, stripped in this order like Paper's DOI validator
+_DOI_PREFIXES = (
+    "https://doi.org/",
+    "http://doi.org/",
+    "https://dx.doi.org/",
+    "http://dx.doi.org/",
+    "doi:",
+)
+_ARXIV_PREFIX = "arxiv:"
+
+# Punctuation becomes a space so "state-of-the-art" matches "state of the art"
+_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation})
 
 
 def generate_paper_id(source: str, external_id: str) -> str:
@@ -13,15 +32,13 @@ def normalize_doi(doi: Optional[str]) -> Optional[str]:
     """Normalize DOI to canonical form."""
     if not doi:
         return None
-    doi = doi.lower().strip()
-    prefixes = [
-        "https://doi.org/",
-        "http://doi.org/",
-        "https://dx.doi.org/",
-        "http://dx.doi.org/",
-        "doi:",
-    ]
-    for prefix in prefixes:
+    return _normalize_doi(doi)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize_doi(doi: str) -> Optional[str]:
+    doi = doi.strip().lower()
+    for prefix in _DOI_PREFIXES:
         if doi.startswith(prefix):
             doi = doi[len(prefix):]
     return doi.strip() or None
@@ -31,19 +48,63 @@ def normalize_arxiv_id(arxiv_id: Optional[str]) -> Optional[str]:
     """Normalize arXiv ID to canonical form."""
     if not arxiv_id:
         return None
+    return _normalize_arxiv_id(arxiv_id)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize_arxiv_id(arxiv_id: str) -> Optional[str]:
     arxiv_id = arxiv_id.strip()
-    if arxiv_id.lower().startswith("arxiv:"):
-        arxiv_id = arxiv_id[6:]
-    if "v" in arxiv_id:
-        parts = arxiv_id.rsplit("v", 1)
-        if parts[-1].isdigit():
-            arxiv_id = parts[0]
+    # Case-insensitive "arxiv:" prefix
+    if arxiv_id[:len(_ARXIV_PREFIX)].lower() == _ARXIV_PREFIX:
+        arxiv_id = arxiv_id[len(_ARXIV_PREFIX):]
+    # Drop a trailing lowercase version suffix such as "v2"
+    head, sep, version = arxiv_id.rpartition("v")
+    if sep and version.isdigit():
+        arxiv_id = head
     return arxiv_id.strip() or None
 
 
+class _FoldTable(dict):
+    """``str.translate`` table for non-ASCII titles, filled on first use of each code point."""
+
+    def __missing__(self, codepoint: int) -> Optional[Union[int, str]]:
+        char = chr(codepoint)
+        if unicodedata.combining(char):
+            value = None
+        elif unicodedata.category(char)[0] == "P":
+            value = " "
+        else:
+            value = codepoint
+        self[codepoint] = value
+        return value
+
+
+# Drops combining accents and maps all punctuation to spaces in one pass;
+# starts from _PUNCT_TABLE so ASCII symbols such as "$" are mapped too
+_FOLD_TABLE = _FoldTable(_PUNCT_TABLE)
+
+
+def _title_key(title: str) -> str:
+    """Fold case, accents, punctuation and whitespace out of a title."""
+    if title.isascii():
+        return " ".join(title.lower().translate(_PUNCT_TABLE).split())
+    # NFKD splits "é" into "e" + combining accent. Only the accents are
+    # dropped, so non-Latin scripts keep their letters and stay distinct.
+    # Known code points are looked up in C, so the per-title work stays there.
+    folded = unicodedata.normalize("NFKD", title).lower().translate(_FOLD_TABLE)
+    return " ".join(folded.split())
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def compute_title_hash(title: str) -> str:
     """Compute normalized hash of a title for deduplication."""
-    import re
-    normalized = re.sub(r'[^\w\s]', '', title.lower())
-    normalized = ' '.join(normalized.split())
-    return hashlib.md5(normalized.encode()).hexdigest()
\ No newline at end of file
+    return hashlib.blake2b(_title_key(title).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def compute_title_hashes(titles: Iterable[str]) -> List[str]:
+    """Compute title hashes for many titles in one call, in input order."""
+    blake2b = hashlib.blake2b
+    return [
+        blake2b(_title_key(title).encode("utf-8"), digest_size=16).hexdigest()
+        for title in titles
+    ]
@@ -65,9 +65,8 @@ class Paper(BaseModel):
         if not v:
             return None
         doi = v.lower().strip()
-        for prefix in ["https://doi.org/", "http://dx.doi.org/", "doi:"]:
-            if doi.startswith(prefix):
-                doi = doi[len(prefix):]
+        for prefix in ("https://doi.org/", "http://dx.doi.org/", "doi:"):
+            doi = doi.removeprefix(prefix)
         return doi or None
 
     @field_validator("arxiv_id")
@@ -2,17 +2,27 @@
 
 import re
 from datetime import datetime, date
-from typing import Optional
+from typing import Callable, Optional
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
 
 
 def normalize_title(title: str) -> str:
     """Normalize a title for comparison."""
     if not title:
         return ""
-    title = title.lower()
-    title = re.sub(r'[^\w\s]', '', title)
-    title = ' '.join(title.split())
-    return title
+    # split/join collapses and trims whitespace in C, faster than a regex
+    return ' '.join(_PUNCT_RE.sub('', title.lower()).split())
+
+
+# Non-ISO formats, most specific first: (format, length, shape check)
+_DATE_FORMATS: tuple[tuple[str, int, Callable[[str], bool]], ...] = (
+    ("%Y/%m/%d", 10, lambda s: len(s) >= 10 and s[4] == '/' and s[7] == '/'),
+    ("%d-%m-%Y", 10, lambda s: len(s) >= 10 and s[2] == '-' and s[5] == '-'),
+    ("%d/%m/%Y", 10, lambda s: len(s) >= 10 and s[2] == '/' and s[5] == '/'),
+    ("%Y-%m", 7, lambda s: len(s) >= 7 and s[4] == '-' and s[:4].isdigit()),
+    ("%Y", 4, lambda s: len(s) >= 4 and s[:4].isdigit()),
+)
 
 
 def parse_date(date_str: Optional[str]) -> Optional[date]:
@@ -24,17 +34,16 @@ def parse_date(date_str: Optional[str]) -> Optional[date]:
     if not date_str:
         return None
 
-    # Try formats from most specific to least specific
-    formats = [
-        ("%Y-%m-%d", 10, lambda s: len(s) >= 10 and s[4] == '-' and s[7] == '-'),
-        ("%Y/%m/%d", 10, lambda s: len(s) >= 10 and s[4] == '/' and s[7] == '/'),
-        ("%d-%m-%Y", 10, lambda s: len(s) >= 10 and s[2] == '-' and s[5] == '-'),
-        ("%d/%m/%Y", 10, lambda s: len(s) >= 10 and s[2] == '/' and s[5] == '/'),
-        ("%Y-%m", 7, lambda s: len(s) >= 7 and s[4] == '-' and s[:4].isdigit()),
-        ("%Y", 4, lambda s: len(s) >= 4 and s[:4].isdigit()),
-    ]
-
-    for fmt, length, validator in formats:
+    # Fast path for YYYY-MM-DD (most API dates), no strptime needed. An
+    # invalid full date is rejected rather than read as YYYY-MM.
+    if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            d = date.fromisoformat(date_str[:10])
+        except ValueError:
+            return None
+        return d if 1900 <= d.year <= 2100 else None
+
+    for fmt, length, validator in _DATE_FORMATS:
         if not validator(date_str):
             continue
 
@@ -62,10 +71,17 @@ def clean_abstract(abstract: Optional[str], max_length: int = 5000) -> Optional[
     """Clean and truncate an abstract."""
     if not abstract:
         return None
-    abstract = ' '.join(abstract.split())
+    # Collapsing whitespace only shortens text, so cleaning a window a bit
+    # longer than max_length yields the same leading characters as cleaning
+    # everything; this bounds the work on very long abstracts
+    window = abstract[:2 * max_length]
+    cleaned = ' '.join(window.split())
+    if len(window) < len(abstract) and len(cleaned) <= max_length:
+        # Window was mostly whitespace, so it may not reach max_length
+        cleaned = ' '.join(abstract.split())
     # Return None if after cleaning it's empty
-    if not abstract:
+    if not cleaned:
         return None
-    if len(abstract) > max_length:
-        abstract = abstract[:max_length] + "..."
-    return abstract
\ No newline at end of file
+    if len(cleaned) > max_length:
+        cleaned = cleaned[:max_length] + "..."
+    return cleaned
\ No newline at end of file
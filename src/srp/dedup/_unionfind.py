@@ -0,0 +1,34 @@
+"""Disjoint-set forest used to group duplicate papers."""
+
+from typing import List
+
+
+class UnionFind:
+    """
+    Union-find over the integers ``0..n-1``.
+
+    Roots are found with path splitting and joined without ranks; the
+    groups produced by deduplication are small and shallow, so this keeps
+    the constant factor low. The smaller index always becomes the root,
+    so a group is headed by its earliest member.
+    """
+
+    def __init__(self, n: int) -> None:
+        self.parent: List[int] = list(range(n))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            # Point x at its grandparent and step to its old parent
+            parent[x], x = parent[parent[x]], parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets containing a and b; False if already merged."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if root_b < root_a:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        return True
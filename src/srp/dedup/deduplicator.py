@@ -1,16 +1,117 @@
 """Multi-strategy deduplication for academic papers."""
 
-from typing import List, Dict, Set, Tuple, Optional
+import os
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
-from rapidfuzz import fuzz
+from functools import partial
+from operator import attrgetter
+import numpy as np
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 
 from ..core.models import Paper, DeduplicationCluster
 from ..core.ids import normalize_doi, normalize_arxiv_id, compute_title_hash
 from ..core.normalization import normalize_title
 from ..utils.logging import get_logger
+from ._unionfind import UnionFind
 
 logger = get_logger(__name__)
 
+# Blocks at least this large are scored with cdist instead of pairwise
+_CDIST_MIN_BLOCK = 32
+
+# Score cells per cdist call (float64, so 32 MiB); large blocks are scored in
+# row chunks of this size instead of as one block x block matrix
+_CDIST_MAX_CELLS = 1 << 22
+
+# Leading words skipped when picking a title's blocking word, so "A Survey of
+# X" and "The Survey of X" land in the same block
+_BLOCK_STOPWORDS = frozenset({
+    "a", "an", "the", "on", "of", "in", "for", "to", "toward", "towards",
+    "and", "with", "from", "by", "at", "is", "are", "how", "what", "why",
+})
+
+
+def _intern(key: Optional[str]) -> Optional[str]:
+    return sys.intern(key) if key else None
+
+
+def _block_word(title: str) -> str:
+    """First word of a normalized title that isn't a leading stopword.
+
+    Falls back to the first word when every word is a stopword.
+    """
+    words = title.split()
+    return next((word for word in words if word not in _BLOCK_STOPWORDS), words[0])
+
+
+def _max_similarity(len_a: int, len_b: int) -> float:
+    """Upper bound on the normalized Indel similarity of two strings.
+
+    The similarity is 2 * LCS / (len_a + len_b) and the LCS can't exceed the
+    shorter string, so pairs whose lengths differ too much can be skipped
+    without computing it.
+    """
+    total = len_a + len_b
+    return 2 * min(len_a, len_b) / total if total else 1.0
+
+
+def _cdist_pairs(
+    titles: List[str],
+    threshold: float,
+    workers: int = -1,
+    max_cells: int = _CDIST_MAX_CELLS,
+) -> List[Tuple[int, int, float]]:
+    """Return (row, col, similarity) for title pairs at or above threshold.
+
+    The block is scored in rapidfuzz's C code, a chunk of rows at a time
+    against the titles from the chunk's first row on, so at most about
+    ``max_cells`` scores are held at once. Pairs come back in the same
+    row-major order as a nested loop over the block.
+    """
+    m = len(titles)
+    chunk = max(1, max_cells // max(m, 1))
+    pairs: List[Tuple[int, int, float]] = []
+    for start in range(0, m, chunk):
+        stop = min(start + chunk, m)
+        scores = process.cdist(
+            titles[start:stop],
+            titles[start:],
+            scorer=Indel.normalized_similarity,
+            score_cutoff=threshold,
+            dtype=np.float64,
+            workers=workers,
+        )
+        rows, cols = np.nonzero(scores >= threshold)
+        # Local col c is title start + c; keep only pairs past the diagonal
+        upper = cols > rows
+        rows, cols = rows[upper], cols[upper]
+        similarities = scores[rows, cols].tolist()
+        pairs.extend(zip((rows + start).tolist(), (cols + start).tolist(), similarities))
+    return pairs
+
+
+def _score_blocks(blocks: List[List[str]], threshold: float) -> List[List[Tuple[int, int, float]]]:
+    """Run _cdist_pairs over each block, in parallel when there are several.
+
+    rapidfuzz releases the GIL while scoring, so blocks run concurrently on
+    threads, each single-threaded to avoid oversubscribing the cores. A lone
+    block instead lets cdist use all cores itself. The threads share one
+    ``_CDIST_MAX_CELLS`` budget, so peak score memory doesn't grow with the
+    core count. Results keep block order.
+    """
+    if len(blocks) == 1:
+        return [_cdist_pairs(blocks[0], threshold)]
+    threads = min(len(blocks), os.cpu_count() or 1)
+    score = partial(
+        _cdist_pairs, threshold=threshold, workers=1, max_cells=_CDIST_MAX_CELLS // threads
+    )
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(score, blocks))
+
 
 class Deduplicator:
     """
@@ -19,7 +120,14 @@ class Deduplicator:
     Strategy:
     1. Exact DOI match (highest confidence)
     2. Exact arXiv ID match
-    3. Fuzzy title + year match (configurable threshold)
+    3. Fuzzy title + year match (configurable threshold), comparing only
+       papers of the same year whose normalized titles share a blocking
+       word: the first word after any leading articles/prepositions
+
+    Blocking trades some recall for speed. Unlike an all-pairs comparison,
+    titles whose first content word differs (a typo in it, reordered or
+    reworded openings) are never compared, even if they would score above
+    the threshold.
     """
 
     def __init__(self, fuzzy_threshold: float = 0.85, merge_strategy: str = "best_completeness") -> None:
@@ -48,117 +156,211 @@ class Deduplicator:
         score += min(len(paper.authors), 10) * 0.5
         return score
 
-    def _select_canonical(self, papers: List[Paper]) -> Paper:
+    def _title_similarity(self, title1: str, title2: str) -> float:
+        # Normalized Indel similarity (same scale as fuzz.ratio / 100); the
+        # cutoff lets rapidfuzz stop early and return 0.0 for clear misses
+        return Indel.normalized_similarity(title1, title2, score_cutoff=self.fuzzy_threshold)
+
+    def _canonical_scores(self, papers: List[Paper], indices: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Per-paper ranking for the merge strategy; None keeps the first member.
+
+        Only the papers at ``indices`` (those in some cluster) are scored,
+        each exactly once; every other entry is left at zero.
+        """
         if self.merge_strategy == "most_citations":
-            return max(papers, key=lambda p: p.citation_count)
-        if self.merge_strategy == "best_completeness":
-            return max(papers, key=self._compute_completeness_score)
-        return papers[0]
+            score, dtype = attrgetter("citation_count"), np.int64
+        elif self.merge_strategy == "best_completeness":
+            score, dtype = self._compute_completeness_score, np.float64
+        else:
+            return None
+        scores = np.zeros(len(papers), dtype=dtype)
+        scores[indices] = np.fromiter((score(papers[i]) for i in indices.tolist()), dtype=dtype, count=len(indices))
+        return scores
+
+    def _select_canonical(self, members: List[int], scores: Optional[np.ndarray]) -> int:
+        if scores is None:
+            return members[0]
+        # argmax keeps the first of tied papers, like max()
+        return members[int(scores[members].argmax())]
 
     def _merge_paper_data(self, canonical: Paper, duplicates: List[Paper]) -> Paper:
-        merged_external_ids = dict(canonical.external_ids)
-        for dup in duplicates:
-            merged_external_ids.update(dup.external_ids)
-        oa_pdf = canonical.open_access_pdf
-        if not oa_pdf:
-            for dup in duplicates:
-                if dup.open_access_pdf:
-                    oa_pdf = dup.open_access_pdf
-                    break
-        merged_fields = set(canonical.fields_of_study)
-        for dup in duplicates:
-            merged_fields.update(dup.fields_of_study)
-        max_citations = max([p.citation_count for p in [canonical] + duplicates])
-        max_influential = max([p.influential_citation_count for p in [canonical] + duplicates])
+        cluster = [canonical, *duplicates]
+        # Later papers win on conflicting keys, as before
+        merged_external_ids: Dict[str, str] = {}
+        for paper in cluster:
+            merged_external_ids.update(paper.external_ids)
+        oa_pdf = canonical.open_access_pdf or next(
+            (dup.open_access_pdf for dup in duplicates if dup.open_access_pdf),
+            canonical.open_access_pdf,
+        )
+        merged_fields = set().union(*map(attrgetter("fields_of_study"), cluster))
+        max_citations = max(map(attrgetter("citation_count"), cluster))
+        max_influential = max(map(attrgetter("influential_citation_count"), cluster))
         merged = canonical.model_copy(deep=True)
         merged.external_ids = merged_external_ids
         merged.open_access_pdf = oa_pdf
-        merged.fields_of_study = sorted(list(merged_fields))
+        merged.fields_of_study = sorted(merged_fields)
         merged.citation_count = max_citations
         merged.influential_citation_count = max_influential
         return merged
 
     def deduplicate(self, papers: List[Paper]) -> Tuple[List[Paper], List[DeduplicationCluster]]:
         logger.info(f"Starting deduplication of {len(papers)} papers")
-        matched_ids: Set[str] = set()
+        n = len(papers)
+        if n < 2:
+            # Nothing to compare; each paper is its own canonical
+            for paper in papers:
+                self._paper_to_canonical[paper.paper_id] = paper.paper_id
+            return list(papers), []
+        # Normalize every key once; the passes below only index these lists.
+        # Interned IDs let repeated keys hit their bucket by identity.
+        norm_doi = [_intern(normalize_doi(p.doi)) for p in papers]
+        norm_arxiv = [_intern(normalize_arxiv_id(p.arxiv_id)) for p in papers]
+        norm_title = [normalize_title(p.title) for p in papers]
+        years = [p.year for p in papers]
+
+        # One byte per paper: 1 once it belongs to a cluster
+        matched = bytearray(n)
         clusters: List[DeduplicationCluster] = []
-        papers_by_id = {p.paper_id: p for p in papers}
-        # Pass 1: exact DOI
-        doi_groups: Dict[str, List[str]] = defaultdict(list)
-        for paper in papers:
-            if paper.doi:
-                doi_groups[paper.doi].append(paper.paper_id)
-        for doi, paper_ids in doi_groups.items():
-            if len(paper_ids) > 1:
-                cluster = DeduplicationCluster(
-                    canonical_id=paper_ids[0],
-                    duplicate_ids=paper_ids[1:],
-                    match_type="doi",
-                    confidence=1.0,
+        # Cluster membership in CSR form: cluster c holds paper indices
+        # member_index[cluster_ptr[c]:cluster_ptr[c + 1]]
+        member_index: List[int] = []
+        cluster_ptr: List[int] = [0]
+        # Canonical paper index per cluster when already known, else None
+        cluster_canonical: List[Optional[int]] = []
+
+        def add_cluster(
+            members: List[int], match_type: str, confidence: float, canonical: Optional[int] = None
+        ) -> None:
+            clusters.append(
+                DeduplicationCluster(
+                    canonical_id=papers[members[0]].paper_id,
+                    duplicate_ids=[papers[i].paper_id for i in members[1:]],
+                    match_type=match_type,
+                    confidence=confidence,
                 )
-                clusters.append(cluster)
-                matched_ids.update(paper_ids)
-        logger.info(f"DOI matching: {len(clusters)} clusters, {len(matched_ids)} papers")
+            )
+            member_index.extend(members)
+            cluster_ptr.append(len(member_index))
+            cluster_canonical.append(canonical)
+            for i in members:
+                matched[i] = 1
+
+        # Pass 1: exact DOI. Under most_citations the best-cited paper of
+        # each DOI is tracked while bucketing (first one wins ties).
+        track_citations = self.merge_strategy == "most_citations"
+        doi_groups: Dict[str, List[int]] = {}
+        doi_best: Dict[str, int] = {}
+        for i, doi in enumerate(norm_doi):
+            if doi:
+                doi_groups.setdefault(doi, []).append(i)
+                if track_citations:
+                    best = doi_best.get(doi)
+                    if best is None or papers[i].citation_count > papers[best].citation_count:
+                        doi_best[doi] = i
+        for doi, members in doi_groups.items():
+            if len(members) > 1:
+                add_cluster(members, "doi", 1.0, doi_best.get(doi))
+        logger.info(f"DOI matching: {len(clusters)} clusters, {matched.count(1)} papers")
         # Pass 2: exact arxiv
-        arxiv_groups: Dict[str, List[str]] = defaultdict(list)
-        for paper in papers:
-            if paper.paper_id not in matched_ids and paper.arxiv_id:
-                arxiv_groups[paper.arxiv_id].append(paper.paper_id)
-        for arxiv_id, paper_ids in arxiv_groups.items():
-            if len(paper_ids) > 1:
-                cluster = DeduplicationCluster(
-                    canonical_id=paper_ids[0],
-                    duplicate_ids=paper_ids[1:],
-                    match_type="arxiv",
-                    confidence=1.0,
-                )
-                clusters.append(cluster)
-                matched_ids.update(paper_ids)
-        logger.info(f"ArXiv matching: {len(clusters)} total clusters, {len(matched_ids)} matched papers")
-        # Pass 3: fuzzy title + year
-        unmatched_papers = [p for p in papers if p.paper_id not in matched_ids]
-        by_year: Dict[Optional[int], List[Paper]] = defaultdict(list)
-        for paper in unmatched_papers:
-            by_year[paper.year].append(paper)
-        fuzzy_matches = 0
-        for year, year_papers in by_year.items():
-            if not year or len(year_papers) < 2:
+        arxiv_groups: Dict[str, List[int]] = {}
+        for i in range(n):
+            if not matched[i] and norm_arxiv[i]:
+                arxiv_groups.setdefault(norm_arxiv[i], []).append(i)
+        for members in arxiv_groups.values():
+            if len(members) > 1:
+                add_cluster(members, "arxiv", 1.0)
+        logger.info(f"ArXiv matching: {len(clusters)} total clusters, {matched.count(1)} matched papers")
+        # Pass 3: fuzzy title + year. Papers are blocked by (year, blocking
+        # word) and only compared within a block; matches are merged with
+        # union-find so a chain of similar titles forms a single cluster.
+        # Papers sharing a year and normalized title are joined up front
+        # (similarity 1.0) and only the first of them enters a block.
+        same_title: Dict[Tuple[int, str], List[int]] = {}
+        for i in range(n):
+            if not matched[i] and years[i] and norm_title[i]:
+                same_title.setdefault((years[i], norm_title[i]), []).append(i)
+        uf = UnionFind(n)
+        edges: List[Tuple[int, float]] = []
+        # Block keys pack the year and a CRC32 of the blocking word into one
+        # int. CRC32, unlike the salted built-in hash(), keeps blocking and so
+        # the clusters identical across runs. A collision merges two blocks,
+        # so titles with different blocking words can then be compared and
+        # matched.
+        blocks: Dict[int, List[int]] = defaultdict(list)
+        for (year, title), members in same_title.items():
+            first = members[0]
+            for i in members[1:]:
+                uf.union(first, i)
+                edges.append((first, 1.0))
+            blocks[(year << 32) | zlib.crc32(_block_word(title).encode())].append(first)
+        lengths = [len(title) for title in norm_title]
+        large_blocks = [members for members in blocks.values() if len(members) >= _CDIST_MIN_BLOCK]
+        if large_blocks:
+            block_titles = [[norm_title[i] for i in members] for members in large_blocks]
+            for members, pairs in zip(large_blocks, _score_blocks(block_titles, self.fuzzy_threshold)):
+                for a, b, similarity in pairs:
+                    if uf.union(members[a], members[b]):
+                        edges.append((members[a], similarity))
+        for members in blocks.values():
+            if len(members) >= _CDIST_MIN_BLOCK:
                 continue
-            normalized_titles: Dict[str, str] = {p.paper_id: normalize_title(p.title) for p in year_papers}
-            for i, paper1 in enumerate(year_papers):
-                if paper1.paper_id in matched_ids:
-                    continue
-                for paper2 in year_papers[i + 1 :]:
-                    if paper2.paper_id in matched_ids:
+            for pos, i in enumerate(members):
+                for j in members[pos + 1 :]:
+                    if _max_similarity(lengths[i], lengths[j]) < self.fuzzy_threshold:
                         continue
-                    title1 = normalized_titles[paper1.paper_id]
-                    title2 = normalized_titles[paper2.paper_id]
-                    if not title1 or not title2:
+                    if uf.find(i) == uf.find(j):
                         continue
-                    similarity = fuzz.ratio(title1, title2) / 100.0
+                    similarity = self._title_similarity(norm_title[i], norm_title[j])
                     if similarity >= self.fuzzy_threshold:
-                        cluster = DeduplicationCluster(
-                            canonical_id=paper1.paper_id,
-                            duplicate_ids=[paper2.paper_id],
-                            match_type="title_fuzzy",
-                            confidence=similarity,
-                        )
-                        clusters.append(cluster)
-                        matched_ids.update([paper1.paper_id, paper2.paper_id])
-                        fuzzy_matches += 1
-        logger.info(f"Fuzzy matching: {fuzzy_matches} new clusters, {len(matched_ids)} total matched")
+                        uf.union(i, j)
+                        edges.append((i, similarity))
+        # A cluster's confidence is its weakest accepted match
+        confidence: Dict[int, float] = {}
+        for i, similarity in edges:
+            root = uf.find(i)
+            confidence[root] = min(similarity, confidence.get(root, 1.0))
+        # Sort candidates by (root, index) so each group is one contiguous run
+        candidates = np.fromiter((i for members in same_title.values() for i in members), dtype=np.int64)
+        roots = np.fromiter((uf.find(i) for i in candidates.tolist()), dtype=np.int64, count=len(candidates))
+        order = np.lexsort((candidates, roots))
+        candidates, roots = candidates[order], roots[order]
+        _, starts, sizes = np.unique(roots, return_index=True, return_counts=True)
+        fuzzy_clusters = 0
+        for start, size in zip(starts.tolist(), sizes.tolist()):
+            if size > 1:
+                members = candidates[start : start + size].tolist()
+                # The root is the group's smallest index, i.e. members[0]
+                add_cluster(members, "title_fuzzy", confidence[members[0]])
+                fuzzy_clusters += 1
+        logger.info(f"Fuzzy matching: {fuzzy_clusters} new clusters, {matched.count(1)} total matched")
         canonical_papers: List[Paper] = []
-        for cluster in clusters:
-            all_ids = [cluster.canonical_id] + cluster.duplicate_ids
-            cluster_papers = [papers_by_id[pid] for pid in all_ids if pid in papers_by_id]
-            canonical = self._select_canonical(cluster_papers)
+        # Score only the members of clusters still lacking a canonical paper
+        unresolved = np.fromiter(
+            (
+                i
+                for c, known in enumerate(cluster_canonical)
+                if known is None
+                for i in member_index[cluster_ptr[c] : cluster_ptr[c + 1]]
+            ),
+            dtype=np.int64,
+        )
+        scores = self._canonical_scores(papers, unresolved)
+        for c, cluster in enumerate(clusters):
+            members = member_index[cluster_ptr[c] : cluster_ptr[c + 1]]
+            cluster_papers = [papers[i] for i in members]
+            best = cluster_canonical[c]
+            if best is None:
+                best = self._select_canonical(members, scores)
+            canonical = papers[best]
             cluster.canonical_id = canonical.paper_id
-            duplicates = [p for p in cluster_papers if p.paper_id != canonical.paper_id]
+            duplicates = [p for p in cluster_papers if p is not canonical]
             merged = self._merge_paper_data(canonical, duplicates)
             canonical_papers.append(merged)
-            for paper_id in all_ids:
-                self._paper_to_canonical[paper_id] = canonical.paper_id
-        unmatched = [p for p in papers if p.paper_id not in matched_ids]
+            for paper in cluster_papers:
+                self._paper_to_canonical[paper.paper_id] = canonical.paper_id
+        unmatched = [papers[i] for i in range(n) if not matched[i]]
         canonical_papers.extend(unmatched)
         for paper in unmatched:
             self._paper_to_canonical[paper.paper_id] = paper.paper_id
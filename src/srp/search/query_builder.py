@@ -1,6 +1,9 @@
 """Systematic query generation for comprehensive literature coverage."""
 
-from typing import List, Set, Dict, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Optional
 from itertools import combinations
 import yaml
 from pathlib import Path
@@ -11,6 +14,20 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_config() -> Mapping[str, Any]:
+    """Read-only default configuration, shared by every QueryBuilder."""
+    return MappingProxyType(
+        {
+            "core_terms": (),
+            "method_terms": (),
+            "context_terms": (),
+            "boolean_operators": ("AND", "OR"),
+            "max_terms_per_query": 5,
+        }
+    )
+
+
 class QueryBuilder:
     """
     Generate systematic queries for literature reviews.
@@ -25,23 +42,14 @@ class QueryBuilder:
     def __init__(self, config_path: Optional[Path] = None) -> None:
         self.config = self._load_config(config_path)
 
-    def _load_config(self, config_path: Optional[Path]) -> dict:
+    def _load_config(self, config_path: Optional[Path]) -> Mapping[str, Any]:
         if config_path and config_path.exists():
             with open(config_path) as f:
                 return yaml.safe_load(f)
-        return {
-            "core_terms": [],
-            "method_terms": [],
-            "context_terms": [],
-            "boolean_operators": ["AND", "OR"],
-            "max_terms_per_query": 5,
-        }
+        return _default_config()
 
     def generate_core_pairs(self, terms: List[str]) -> List[str]:
-        queries: List[str] = []
-        for term1, term2 in combinations(terms, 2):
-            queries.append(f"{term1} {term2}")
-        return queries
+        return [f"{term1} {term2}" for term1, term2 in combinations(terms, 2)]
 
     def generate_augmented_queries(
         self,
@@ -51,6 +59,7 @@ class QueryBuilder:
     ) -> List[str]:
         queries: List[str] = []
         for core in core_queries:
+            core = sys.intern(core)
             queries.append(core)
             # Skip augmentation if no terms provided
             if not augmentation_terms:
@@ -76,29 +85,28 @@ class QueryBuilder:
         context_terms: Optional[List[str]] = None,
         include_augmented: bool = True,
     ) -> List[str]:
-        queries: Set[str] = set()
+        queries: List[str] = []
         core_queries = self.generate_core_pairs(core_terms)
-        queries.update(core_queries)
+        queries.extend(core_queries)
         logger.info(f"Generated {len(core_queries)} core pair queries")
         if include_augmented:
             if method_terms:
                 method_augmented = self.generate_augmented_queries(core_queries, method_terms, max_augmentations=2)
-                queries.update(method_augmented)
+                queries.extend(method_augmented)
                 logger.info(f"Added {len(method_augmented)} method-augmented queries")
             if context_terms:
                 context_augmented = self.generate_augmented_queries(core_queries, context_terms, max_augmentations=2)
-                queries.update(context_augmented)
+                queries.extend(context_augmented)
                 logger.info(f"Added {len(context_augmented)} context-augmented queries")
-        query_list = sorted(list(queries))
+        # Augmented lists repeat every core query; dedupe in one pass, then sort
+        query_list = sorted(sys.intern(q) for q in dict.fromkeys(queries))
         logger.info(f"Total queries generated: {len(query_list)}")
         return query_list
 
     def save_queries(self, queries: List[str], output_path: Path) -> None:
-        with open(output_path, "w") as f:
-            f.write("# Generated Search Queries\n\n")
-            f.write(f"Total queries: {len(queries)}\n\n")
-            for i, query in enumerate(queries, 1):
-                f.write(f"{i}. `{query}`\n")
+        lines = [f"{i}. `{query}`\n" for i, query in enumerate(queries, 1)]
+        text = f"# Generated Search Queries\n\nTotal queries: {len(queries)}\n\n" + "".join(lines)
+        output_path.write_text(text, encoding="utf-8")
         logger.info(f"Saved {len(queries)} queries to {output_path}")
 
 
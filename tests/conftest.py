@@ -0,0 +1,33 @@
+"""Shared pytest fixtures."""
+
+from functools import lru_cache
+
+import pytest
+
+from srp.core.models import Author, Source
+
+DEFAULT_TIMESTAMP = "2025-11-08T10:00:00Z"
+
+
+@lru_cache(maxsize=32)
+def _make_source(database: str, query: str, timestamp: str = DEFAULT_TIMESTAMP) -> Source:
+    """Build (once) a Source for the given provenance."""
+    return Source(database=database, query=query, timestamp=timestamp)
+
+
+@pytest.fixture(scope="session")
+def default_source() -> Source:
+    """Source for papers whose provenance the test doesn't inspect."""
+    return _make_source("test", "test")
+
+
+@pytest.fixture(scope="session")
+def default_author() -> Author:
+    """Minimal author."""
+    return Author(name="Alice")
+
+
+@pytest.fixture(scope="session")
+def make_source():
+    """Factory for cached Source variants, e.g. ``make_source("openalex", "NLP")``."""
+    return _make_source
@@ -0,0 +1,507 @@
+"""Unit tests for the async search task queue and its state backends."""
+
+import asyncio
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from srp.async_queue.state_backend import FileStateBackend, MemoryStateBackend
+from srp.async_queue.task_queue import SearchTask, TaskQueue, TaskStatus
+from srp.core.models import Paper, Source
+
+
+def make_paper(paper_id: str = "test:1") -> Paper:
+    """Helper to construct a Paper for testing."""
+    return Paper(
+        paper_id=paper_id,
+        title="Sample Paper",
+        source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+    )
+
+
+def make_task(query: str = "AI", **kwargs) -> SearchTask:
+    """Helper to construct a SearchTask for testing."""
+    return SearchTask(source="openalex", query=query, **kwargs)
+
+
+@pytest.fixture
+def backend() -> MemoryStateBackend:
+    """Fresh in-memory state, shared by queues to simulate restarts."""
+    return MemoryStateBackend()
+
+
+@pytest.fixture
+async def queue(backend: MemoryStateBackend):
+    """Queue on the in-memory backend, closed after the test."""
+    q = TaskQueue(state_backend=backend)
+    yield q
+    await q.aclose()
+
+
+class TestSearchTask:
+    """Tests for SearchTask."""
+
+    def test_task_defaults(self) -> None:
+        """Test a new task is pending with a generated ID."""
+        task = make_task()
+        assert len(task.task_id) == 16
+        assert task.status == TaskStatus.PENDING
+        assert task.priority == 0
+        assert task.retry_count == 0
+
+    def test_task_dict_roundtrip(self) -> None:
+        """Test to_dict/from_dict preserves the search parameters."""
+        task = make_task(
+            start_date=date(2020, 1, 1),
+            end_date=date(2024, 12, 31),
+            limit=100,
+            priority=2,
+        )
+        task.papers_path = "abc.jsonl"
+
+        restored = SearchTask.from_dict(task.to_dict())
+
+        assert restored.task_id == task.task_id
+        assert restored.start_date == date(2020, 1, 1)
+        assert restored.end_date == date(2024, 12, 31)
+        assert restored.limit == 100
+        assert restored.priority == 2
+        assert restored.papers_path == "abc.jsonl"
+
+
+class TestTaskQueueOrdering:
+    """Tests for dequeue order."""
+
+    async def test_priority_ordering(self, queue: TaskQueue) -> None:
+        """Test lower priority numbers are dequeued first."""
+        await queue.enqueue(make_task("low", priority=5))
+        await queue.enqueue(make_task("high", priority=0))
+        await queue.enqueue(make_task("mid", priority=2))
+
+        queries = [(await queue.dequeue(timeout=1.0)).query for _ in range(3)]
+
+        assert queries == ["high", "mid", "low"]
+
+    async def test_fifo_within_priority(self, queue: TaskQueue) -> None:
+        """Test tasks with equal priority keep insertion order."""
+        for i in range(5):
+            await queue.enqueue(make_task(f"q{i}", priority=1))
+
+        queries = [(await queue.dequeue(timeout=1.0)).query for _ in range(5)]
+
+        assert queries == [f"q{i}" for i in range(5)]
+
+    async def test_dequeue_marks_running(self, queue: TaskQueue) -> None:
+        """Test a dequeued task moves from pending to running."""
+        task_id = await queue.enqueue(make_task())
+
+        task = await queue.dequeue(timeout=1.0)
+
+        assert task.task_id == task_id
+        assert task.status == TaskStatus.RUNNING
+        assert task_id in queue.running_tasks
+        assert await queue.size() == 0
+
+    async def test_dequeue_timeout(self, queue: TaskQueue) -> None:
+        """Test dequeue returns None on an empty queue after the timeout."""
+        assert await queue.dequeue(timeout=0.01) is None
+
+    async def test_cancelled_task_skipped(self, queue: TaskQueue) -> None:
+        """Test a cancelled pending task is never dequeued."""
+        cancelled_id = await queue.enqueue(make_task("a"))
+        kept_id = await queue.enqueue(make_task("b"))
+        await queue.cancel_task(cancelled_id)
+
+        assert await queue.size() == 1
+        assert (await queue.dequeue(timeout=1.0)).task_id == kept_id
+        assert await queue.dequeue(timeout=0.01) is None
+
+    async def test_failed_task_retried_with_penalty(self, queue: TaskQueue) -> None:
+        """Test a failed task is re-queued until its retries run out."""
+        task_id = await queue.enqueue(make_task(max_retries=2))
+        await queue.dequeue(timeout=1.0)
+        await queue.fail_task(task_id, "boom")
+
+        task = queue.get_task(task_id)
+        assert task.status == TaskStatus.PENDING
+        assert task.priority == 10
+
+        assert (await queue.dequeue(timeout=1.0)).task_id == task_id
+        await queue.fail_task(task_id, "boom again")
+        assert task.status == TaskStatus.FAILED
+        assert await queue.size() == 0
+
+    async def test_get_tasks_by_status(self, queue: TaskQueue) -> None:
+        """Test the status index follows each transition."""
+        done_id = await queue.enqueue(make_task("a"))
+        pending_id = await queue.enqueue(make_task("b"))
+        await queue.dequeue(timeout=1.0)
+        await queue.complete_task(done_id, [])
+
+        assert [t.task_id for t in queue.get_tasks_by_status(TaskStatus.COMPLETED)] == [done_id]
+        assert [t.task_id for t in queue.get_tasks_by_status(TaskStatus.PENDING)] == [pending_id]
+        assert queue.get_tasks_by_status(TaskStatus.RUNNING) == []
+
+    async def test_get_tasks_by_status_keeps_order(self, queue: TaskQueue) -> None:
+        """Test tasks are listed in the order they entered the status."""
+        task_ids = [await queue.enqueue(make_task(f"q{i}")) for i in range(8)]
+
+        pending = queue.get_tasks_by_status(TaskStatus.PENDING)
+        assert [t.task_id for t in pending] == task_ids
+
+        for _ in range(3):
+            await queue.dequeue(timeout=1.0)
+        for task_id in reversed(task_ids[:3]):
+            await queue.complete_task(task_id, [])
+        completed = queue.get_tasks_by_status(TaskStatus.COMPLETED)
+        assert [t.task_id for t in completed] == list(reversed(task_ids[:3]))
+        pending = queue.get_tasks_by_status(TaskStatus.PENDING)
+        assert [t.task_id for t in pending] == task_ids[3:]
+
+    async def test_concurrent_dequeue_unique(self, queue: TaskQueue) -> None:
+        """Test concurrent workers never receive the same task."""
+        for i in range(12):
+            await queue.enqueue(make_task(f"q{i}"))
+
+        async def worker() -> list[str]:
+            return [(await queue.dequeue(timeout=1.0)).task_id for _ in range(4)]
+
+        results = await asyncio.gather(*[worker() for _ in range(3)])
+
+        all_ids = [tid for ids in results for tid in ids]
+        assert len(set(all_ids)) == 12
+
+
+class TestTaskQueueCapacity:
+    """Tests for max_size."""
+
+    async def test_full_queue_rejects(self, backend: MemoryStateBackend) -> None:
+        """Test enqueue fails once max_size tasks are pending."""
+        queue = TaskQueue(state_backend=backend, max_size=2)
+        await queue.enqueue(make_task("a"))
+        await queue.enqueue(make_task("b"))
+
+        with pytest.raises(ValueError, match="Queue full"):
+            await queue.enqueue(make_task("c"))
+        assert len(queue.get_all_tasks()) == 2
+        await queue.aclose()
+
+    async def test_cancelled_entries_dont_count(self, backend: MemoryStateBackend) -> None:
+        """Test cancelled tasks left in the heap don't use up capacity."""
+        queue = TaskQueue(state_backend=backend, max_size=2)
+        await queue.cancel_task(await queue.enqueue(make_task("a")))
+        await queue.enqueue(make_task("b"))
+
+        await queue.enqueue(make_task("c"))
+
+        assert await queue.size() == 2
+        await queue.aclose()
+
+    async def test_retry_requeued_when_full(self, backend: MemoryStateBackend) -> None:
+        """Test a failed task is re-queued even when the queue is at capacity."""
+        queue = TaskQueue(state_backend=backend, max_size=1)
+        task_id = await queue.enqueue(make_task("a"))
+        await queue.dequeue(timeout=1.0)
+        await queue.enqueue(make_task("b"))
+
+        await queue.fail_task(task_id, "boom")
+
+        assert await queue.size() == 2
+        assert {(await queue.dequeue(timeout=1.0)).query for _ in range(2)} == {"a", "b"}
+        await queue.aclose()
+
+
+class TestTaskQueueDedup:
+    """Tests for duplicate search detection."""
+
+    async def test_duplicate_returns_existing_id(self, queue: TaskQueue) -> None:
+        """Test an identical live search isn't queued twice."""
+        first = await queue.enqueue(make_task(limit=5))
+        second = await queue.enqueue(make_task(limit=5))
+        other = await queue.enqueue(make_task(limit=6))
+
+        assert first == second
+        assert other != first
+        assert await queue.size() == 2
+
+    async def test_different_config_not_merged(self, queue: TaskQueue) -> None:
+        """Test searches differing only in config are separate tasks."""
+        lg = await queue.enqueue(make_task(config={"categories": ["cs.LG"], "max_results": 50}))
+        cv = await queue.enqueue(make_task(config={"categories": ["cs.CV"], "max_results": 50}))
+        reordered = await queue.enqueue(make_task(config={"max_results": 50, "categories": ["cs.LG"]}))
+
+        assert lg != cv
+        assert reordered == lg
+        assert await queue.size() == 2
+
+    async def test_finished_task_evicted(self, queue: TaskQueue) -> None:
+        """Test a finished search can be queued again."""
+        first = await queue.enqueue(make_task())
+        await queue.dequeue(timeout=1.0)
+        await queue.complete_task(first, [])
+
+        again = await queue.enqueue(make_task())
+
+        assert again != first
+        assert await queue.size() == 1
+
+    async def test_cancelled_task_evicted(self, queue: TaskQueue) -> None:
+        """Test a cancelled search can be queued again."""
+        first = await queue.enqueue(make_task())
+        await queue.cancel_task(first)
+
+        assert await queue.enqueue(make_task()) != first
+
+    async def test_dedup_disabled(self, backend: MemoryStateBackend) -> None:
+        """Test every enqueue creates a task when dedup is off."""
+        queue = TaskQueue(state_backend=backend, dedup=False)
+
+        assert await queue.enqueue(make_task()) != await queue.enqueue(make_task())
+        await queue.aclose()
+
+
+class TestTaskQueuePersistence:
+    """Tests for the write-ahead log and snapshots."""
+
+    async def test_memory_backend_restart(self, backend: MemoryStateBackend) -> None:
+        """Test pending tasks survive a restart on a shared backend."""
+        queue1 = TaskQueue(state_backend=backend)
+        task_id = await queue1.enqueue(make_task(priority=3))
+        await queue1.aclose()
+
+        queue2 = TaskQueue(state_backend=backend)
+        await queue2.load()
+
+        assert queue2.get_task(task_id).priority == 3
+        assert [t.task_id for t in queue2.get_all_tasks()] == [task_id]
+        assert (await queue2.dequeue(timeout=1.0)).task_id == task_id
+        await queue2.aclose()
+
+    async def test_wal_replay_after_crash(self, backend: MemoryStateBackend) -> None:
+        """Test logged changes are replayed when no snapshot was written."""
+        queue1 = TaskQueue(state_backend=backend)
+        done_id = await queue1.enqueue(make_task("a"))
+        running_id = await queue1.enqueue(make_task("b"))
+        await queue1.dequeue(timeout=1.0)
+        await queue1.complete_task(done_id, [])
+        await queue1.dequeue(timeout=1.0)
+        await queue1.flush()
+        # Simulate a crash: no aclose(), so no snapshot
+        assert backend.snapshot is None
+        assert len(backend.events) == 5
+
+        queue2 = TaskQueue(state_backend=backend)
+        await queue2.load()
+
+        assert queue2.get_task(done_id).status == TaskStatus.COMPLETED
+        # Tasks that were running are re-queued
+        assert queue2.get_task(running_id).status == TaskStatus.PENDING
+        assert (await queue2.dequeue(timeout=1.0)).task_id == running_id
+        await queue2.aclose()
+
+    async def test_snapshot_truncates_log(self, backend: MemoryStateBackend) -> None:
+        """Test reaching snapshot_every writes a snapshot and empties the log."""
+        queue1 = TaskQueue(state_backend=backend, snapshot_every=3)
+        first = await queue1.enqueue(make_task("a"))
+        await queue1.enqueue(make_task("b"))
+        await queue1.flush()
+        assert backend.snapshot is None
+        assert len(backend.events) == 2
+
+        await queue1.cancel_task(first)
+        await queue1.flush()
+
+        assert backend.snapshot is not None
+        assert backend.events == []
+
+        # Later events land in the log and replay on top of the snapshot
+        await queue1.enqueue(make_task("c"))
+        await queue1.flush()
+        assert len(backend.events) == 1
+
+        queue2 = TaskQueue(state_backend=backend)
+        await queue2.load()
+        assert queue2.get_task(first).status == TaskStatus.CANCELLED
+        assert await queue2.size() == 2
+        await queue1.aclose()
+        await queue2.aclose()
+
+    async def test_file_backend_restart(self, tmp_path: Path) -> None:
+        """Test the file backend writes a log, then a snapshot on close."""
+        state_file = tmp_path / "state.json"
+        queue1 = TaskQueue(state_file=state_file)
+        task_id = await queue1.enqueue(make_task())
+        await queue1.flush()
+        wal_path = state_file.with_suffix(".wal")
+        assert len(wal_path.read_bytes().splitlines()) == 1
+
+        await queue1.aclose()
+        assert state_file.exists()
+        assert wal_path.read_bytes() == b""
+
+        queue2 = TaskQueue(state_file=state_file)
+        await queue2.load()
+        assert queue2.get_task(task_id).status == TaskStatus.PENDING
+        await queue2.aclose()
+
+    async def test_torn_log_line_ignored(self, tmp_path: Path) -> None:
+        """Test a partial last log line from a crash is skipped on load."""
+        state_file = tmp_path / "state.json"
+        queue1 = TaskQueue(state_file=state_file)
+        task_id = await queue1.enqueue(make_task())
+        await queue1.flush()
+        with open(state_file.with_suffix(".wal"), "ab") as f:
+            f.write(b'{"seq": 2, "op": "sta')
+
+        queue2 = TaskQueue(state_file=state_file)
+        await queue2.load()
+
+        assert [t.task_id for t in queue2.get_all_tasks()] == [task_id]
+        await queue1.aclose()
+        await queue2.aclose()
+
+
+class FailingOnceBackend(MemoryStateBackend):
+    """Memory backend whose first log append fails with a non-I/O error."""
+
+    def __init__(self):
+        super().__init__()
+        self.failed = False
+
+    async def append(self, records: list[bytes]) -> None:
+        if not self.failed:
+            self.failed = True
+            raise RuntimeError("backend bug")
+        await super().append(records)
+
+
+class DiskFullBackend(MemoryStateBackend):
+    """Memory backend whose log appends fail with OSError until ``full`` is cleared."""
+
+    def __init__(self):
+        super().__init__()
+        self.full = True
+        self.attempts = 0
+
+    async def append(self, records: list[bytes]) -> None:
+        self.attempts += 1
+        if self.full:
+            raise OSError("No space left on device")
+        await super().append(records)
+
+
+class TestTaskQueuePersistenceErrors:
+    """Tests for state that can't be written."""
+
+    async def test_unserializable_task_rejected_on_enqueue(self, queue: TaskQueue) -> None:
+        """Test a task the encoder can't handle is refused without side effects."""
+        with pytest.raises(TypeError):
+            await queue.enqueue(make_task(config={"bad": object()}))
+
+        assert queue.get_all_tasks() == []
+        assert await queue.size() == 0
+        # The same search with a valid config is not treated as a duplicate
+        task_id = await queue.enqueue(make_task())
+        await queue.flush()
+        assert queue.get_task(task_id) is not None
+
+    async def test_flusher_survives_backend_error(self) -> None:
+        """Test a non-I/O write error sets the batch aside and keeps flushing."""
+        backend = FailingOnceBackend()
+        queue = TaskQueue(state_backend=backend, flush_delay=0.001)
+        await queue.enqueue(make_task("a"))
+        await asyncio.sleep(0.05)
+        assert backend.failed
+        assert backend.events == []
+
+        await queue.enqueue(make_task("b"))
+        await asyncio.sleep(0.05)
+
+        assert len(backend.events) == 1
+        assert len(queue._rejected_events) == 1
+        await queue.aclose()
+
+    async def test_flusher_backs_off_on_io_error(self) -> None:
+        """Test a lasting I/O error is retried with backoff and later persisted."""
+        backend = DiskFullBackend()
+        queue = TaskQueue(state_backend=backend, flush_delay=0.01)
+        await queue.enqueue(make_task())
+        await asyncio.sleep(0.3)
+
+        # 0.01s, then 0.02, 0.04, 0.08, 0.16... instead of every 0.01s
+        assert 2 <= backend.attempts <= 5
+        assert len(queue._wal_buffer) == 1
+
+        backend.full = False
+        await queue.flush()
+        assert len(backend.events) == 1
+        assert queue._wal_buffer == []
+        await queue.aclose()
+
+    async def test_unencodable_snapshot_falls_back_to_log(
+        self, queue: TaskQueue, backend: MemoryStateBackend
+    ) -> None:
+        """Test a task mutated into an unencodable state doesn't block the log."""
+        task_id = await queue.enqueue(make_task())
+        queue.get_task(task_id).config["bad"] = object()
+
+        await queue.flush(snapshot=True)
+
+        assert backend.snapshot is None
+        assert len(backend.events) == 1
+        queue.get_task(task_id).config.clear()
+
+
+class TestTaskQueuePapers:
+    """Tests for papers stored as backend artifacts."""
+
+    async def test_load_papers(self, queue: TaskQueue, backend: MemoryStateBackend) -> None:
+        """Test completed papers are stored off the task and read back."""
+        task_id = await queue.enqueue(make_task())
+        await queue.dequeue(timeout=1.0)
+        await queue.complete_task(task_id, [make_paper("x:1"), make_paper("x:2")])
+
+        task = queue.get_task(task_id)
+        assert task.papers_fetched == 2
+        assert task.papers_path in backend.artifacts
+        papers = await queue.load_papers(task_id)
+        assert [p.paper_id for p in papers] == ["x:1", "x:2"]
+
+    async def test_load_papers_empty_and_unknown(self, queue: TaskQueue) -> None:
+        """Test a task with no papers gives [] and an unknown task None."""
+        task_id = await queue.enqueue(make_task())
+        await queue.dequeue(timeout=1.0)
+        await queue.complete_task(task_id, [])
+
+        assert queue.get_task(task_id).papers_path is None
+        assert await queue.load_papers(task_id) == []
+        assert await queue.load_papers("missing") is None
+
+    async def test_load_papers_after_restart(self, tmp_path: Path) -> None:
+        """Test artifacts written by one queue are readable after a restart."""
+        state_file = tmp_path / "state.json"
+        queue1 = TaskQueue(state_file=state_file)
+        task_id = await queue1.enqueue(make_task())
+        await queue1.dequeue(timeout=1.0)
+        await queue1.complete_task(task_id, [make_paper()])
+        await queue1.aclose()
+        assert isinstance(queue1.state_backend, FileStateBackend)
+        assert queue1.state_backend.artifacts_dir.is_dir()
+
+        queue2 = TaskQueue(state_file=state_file)
+        papers = await queue2.load_papers(task_id)
+
+        assert [p.paper_id for p in papers] == ["test:1"]
+        await queue2.aclose()
+
+    async def test_load_papers_missing_artifact(self, tmp_path: Path) -> None:
+        """Test a deleted artifact file gives None instead of raising."""
+        queue = TaskQueue(state_file=tmp_path / "state.json")
+        task_id = await queue.enqueue(make_task())
+        await queue.dequeue(timeout=1.0)
+        await queue.complete_task(task_id, [make_paper()])
+        Path(queue.get_task(task_id).papers_path).unlink()
+
+        assert await queue.load_papers(task_id) is None
+        await queue.aclose()
@@ -7,7 +7,9 @@ from srp.core.ids import (
     normalize_doi,
     normalize_arxiv_id,
     compute_title_hash,
+    compute_title_hashes,
 )
+from srp.core.models import Paper, Source
 
 
 class TestNormalizeDOI:
@@ -75,6 +77,34 @@ class TestNormalizeDOI:
             result = normalize_doi(f"{prefix}10.1234/test")
             assert result == "10.1234/test", f"Failed for prefix: {prefix}"
 
+    @pytest.mark.parametrize(
+        "doi,expected",
+        [
+            ("doi:https://doi.org/10.1/x", "https://doi.org/10.1/x"),
+            ("https://doi.org/doi:10.1/x", "10.1/x"),
+            ("doi:", None),
+            ("  DOI:  10.1/X ", "10.1/x"),
+        ],
+        ids=["prefixes_in_order", "chained_prefixes", "prefix_only", "space_after_prefix"],
+    )
+    def test_normalize_doi_prefix_edge_cases(self, doi: str, expected: str | None) -> None:
+        """Test prefixes are removed in list order and the rest is stripped."""
+        assert normalize_doi(doi) == expected
+
+    @pytest.mark.parametrize(
+        "doi",
+        ["https://doi.org/doi:10.1/x", "doi:10.1/X", "HTTP://DX.DOI.ORG/10.1/x"],
+    )
+    def test_normalize_doi_matches_paper_validator(self, doi: str) -> None:
+        """Test normalize_doi agrees with the Paper model's DOI validator."""
+        paper = Paper(
+            paper_id="test:1",
+            title="Test",
+            doi=doi,
+            source=Source(database="openalex", query="q", timestamp="2024-01-01T00:00:00"),
+        )
+        assert normalize_doi(doi) == paper.doi
+
 
 class TestNormalizeArxivID:
     """Tests for arXiv ID normalization."""
@@ -135,6 +165,29 @@ class TestNormalizeArxivID:
         arxiv_id = "cs.CV/1234"
         assert normalize_arxiv_id(arxiv_id) == arxiv_id
 
+    @pytest.mark.parametrize(
+        "arxiv_id,expected",
+        [
+            ("arxiv:", None),
+            ("v2", None),
+            ("1234.5678V2", "1234.5678V2"),
+            ("arxiv:  1234.5678v3 ", "1234.5678"),
+            ("2301.00001 v2", "2301.00001"),
+            ("solv-int/9901001", "solv-int/9901001"),
+        ],
+        ids=[
+            "bare_prefix",
+            "bare_version",
+            "uppercase_version",
+            "spaced",
+            "space_before_version",
+            "v_in_archive",
+        ],
+    )
+    def test_normalize_arxiv_edge_cases(self, arxiv_id: str, expected: str | None) -> None:
+        """Test the result is stripped, and None when nothing but a prefix or version is left."""
+        assert normalize_arxiv_id(arxiv_id) == expected
+
 
 class TestGeneratePaperID:
     """Tests for paper ID generation."""
@@ -160,6 +213,11 @@ class TestGeneratePaperID:
         id2 = generate_paper_id("openalex", "W123")
         assert id1 == id2
 
+    def test_generate_paper_id_non_string_external_id(self) -> None:
+        """Test a missing or numeric external ID is formatted, not rejected."""
+        assert generate_paper_id("semantic_scholar", None) == "semantic_scholar:None"
+        assert generate_paper_id("crossref", 42) == "crossref:42"
+
     def test_generate_paper_id_different_sources(self) -> None:
         """Test different sources produce different IDs for same external ID."""
         id1 = generate_paper_id("openalex", "123")
@@ -176,7 +234,7 @@ class TestComputeTitleHash:
         """Test basic title hashing."""
         hash1 = compute_title_hash("Machine Learning for NLP")
         assert isinstance(hash1, str)
-        assert len(hash1) == 32  # MD5 hex digest
+        assert len(hash1) == 32  # 128-bit hex digest
 
     def test_compute_title_hash_deterministic(self) -> None:
         """Test hash is deterministic."""
@@ -218,6 +276,21 @@ class TestComputeTitleHash:
         assert isinstance(hash1, str)
         assert isinstance(hash2, str)
 
+    def test_compute_title_hash_accents_folded(self) -> None:
+        """Test accented and unaccented spellings hash the same."""
+        assert compute_title_hash("Café: A Study") == compute_title_hash("Cafe A Study")
+        assert compute_title_hash("Über Lernen") == compute_title_hash("uber lernen")
+
+    def test_compute_title_hash_punctuation_in_accented_title(self) -> None:
+        """Test ASCII and Unicode punctuation both fold away in non-ASCII titles."""
+        assert compute_title_hash("Café — “Study” (2nd ed.)") == compute_title_hash("cafe study 2nd ed")
+        assert compute_title_hash("Café $Study") == compute_title_hash("Cafe Study")
+
+    def test_compute_title_hash_non_latin_distinct(self) -> None:
+        """Test non-Latin titles are not folded away to the same hash."""
+        assert compute_title_hash("机器学习") != compute_title_hash("深度学习")
+        assert compute_title_hash("机器学习") != compute_title_hash("")
+
     def test_compute_title_hash_different_titles(self) -> None:
         """Test different titles produce different hashes."""
         hash1 = compute_title_hash("Machine Learning")
@@ -236,3 +309,15 @@ class TestComputeTitleHash:
         hash2 = compute_title_hash("NLP for Machine Learning")
         assert hash1 != hash2
 
+
+class TestComputeTitleHashes:
+    """Tests for bulk title hash computation."""
+
+    def test_compute_title_hashes_matches_single(self) -> None:
+        """Test bulk hashes equal per-title hashes, in order."""
+        titles = ["Machine Learning: A Survey", "Café Study", "", "Deep Learning"]
+        assert compute_title_hashes(titles) == [compute_title_hash(t) for t in titles]
+
+    def test_compute_title_hashes_empty(self) -> None:
+        """Test empty input gives empty output."""
+        assert compute_title_hashes([]) == []
@@ -6,208 +6,229 @@ from pydantic import ValidationError
 
 from srp.core.models import Author, Source, Paper, Reference, DeduplicationCluster
 
+DOI_NORMALIZATION_CASES = (
+    ("https://doi.org/10.1234/ABC", "10.1234/abc"),
+    ("http://dx.doi.org/10.1234/ABC", "10.1234/abc"),
+    ("DOI:10.1234/ABC", "10.1234/abc"),
+    ("10.1234/ABC", "10.1234/abc"),
+)
+
+FULL_AUTHORS = (
+    Author(name="Alice", author_id="A1"),
+    Author(name="Bob", author_id="A2"),
+)
+FULL_FIELDS_OF_STUDY = ("Computer Science", "AI")
+FULL_KEYWORDS = ("NLP", "transformers")
+FULL_EXTERNAL_IDS = {"MAG": "123456", "PubMed": "789"}
+
+# Valid cluster to derive variants from; model_copy skips validation, so
+# tests of the validators construct clusters directly
+BASE_CLUSTER = DeduplicationCluster(
+    canonical_id="paper:1",
+    duplicate_ids=["paper:2"],
+    match_type="doi",
+    confidence=1.0,
+)
+
 
 class TestAuthorModel:
     """Tests for Author model."""
 
-    def test_author_minimal(self) -> None:
-        """Test Author with only required field (name)."""
-        author = Author(name="John Doe")
-        assert author.name == "John Doe"
-        assert author.author_id is None
-        assert author.orcid is None
-        assert author.affiliation is None
-
-    def test_author_full(self) -> None:
-        """Test Author with all fields."""
-        author = Author(
-            name="Jane Smith",
-            author_id="A123456789",
-            orcid="0000-0001-2345-6789",
-            affiliation="MIT",
-        )
-        assert author.name == "Jane Smith"
-        assert author.author_id == "A123456789"
-        assert author.orcid == "0000-0001-2345-6789"
-        assert author.affiliation == "MIT"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"name": "John Doe"},
+                {"name": "John Doe", "author_id": None, "orcid": None, "affiliation": None},
+            ),
+            (
+                {
+                    "name": "Jane Smith",
+                    "author_id": "A123456789",
+                    "orcid": "0000-0001-2345-6789",
+                    "affiliation": "MIT",
+                },
+                {
+                    "name": "Jane Smith",
+                    "author_id": "A123456789",
+                    "orcid": "0000-0001-2345-6789",
+                    "affiliation": "MIT",
+                },
+            ),
+        ],
+        ids=["minimal", "full"],
+    )
+    def test_author_construction(self, kwargs: dict, expected: dict) -> None:
+        """Test Author with only the required name and with all fields."""
+        assert Author(**kwargs).model_dump() == expected
 
 
 class TestSourceModel:
     """Tests for Source model."""
 
-    def test_source_required_fields(self) -> None:
-        """Test Source with required fields."""
-        source = Source(
-            database="openalex",
-            query="machine learning",
-            timestamp="2025-11-08T10:00:00Z",
-        )
-        assert source.database == "openalex"
-        assert source.query == "machine learning"
-        assert source.timestamp == "2025-11-08T10:00:00Z"
-        assert source.page is None
-        assert source.cursor is None
-
-    def test_source_with_pagination(self) -> None:
-        """Test Source with pagination info."""
-        source = Source(
-            database="semantic_scholar",
-            query="NLP transformers",
-            timestamp="2025-11-08T10:00:00Z",
-            page=5,
-            cursor="abc123",
-        )
-        assert source.page == 5
-        assert source.cursor == "abc123"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {
+                    "database": "openalex",
+                    "query": "machine learning",
+                    "timestamp": "2025-11-08T10:00:00Z",
+                },
+                {
+                    "database": "openalex",
+                    "query": "machine learning",
+                    "timestamp": "2025-11-08T10:00:00Z",
+                    "page": None,
+                    "cursor": None,
+                },
+            ),
+            (
+                {
+                    "database": "semantic_scholar",
+                    "query": "NLP transformers",
+                    "timestamp": "2025-11-08T10:00:00Z",
+                    "page": 5,
+                    "cursor": "abc123",
+                },
+                {
+                    "database": "semantic_scholar",
+                    "query": "NLP transformers",
+                    "timestamp": "2025-11-08T10:00:00Z",
+                    "page": 5,
+                    "cursor": "abc123",
+                },
+            ),
+        ],
+        ids=["required_fields", "with_pagination"],
+    )
+    def test_source_construction(self, kwargs: dict, expected: dict) -> None:
+        """Test Source with required fields and with pagination info."""
+        assert Source(**kwargs).model_dump() == expected
 
 
 class TestPaperModel:
     """Tests for Paper model."""
 
-    def test_paper_minimal(self) -> None:
+    def test_paper_minimal(self, default_source: Source) -> None:
         """Test Paper with minimal required fields."""
         paper = Paper(
             paper_id="test:123",
             title="Sample Paper Title",
-            source=Source(
-                database="test",
-                query="sample",
-                timestamp="2025-11-08T10:00:00Z",
-            ),
+            source=default_source,
         )
         assert paper.paper_id == "test:123"
         assert paper.title == "Sample Paper Title"
         assert paper.doi is None
         assert paper.arxiv_id is None
-        assert len(paper.authors) == 0
+        assert not paper.authors
         assert paper.citation_count == 0
         assert paper.is_open_access is False
 
-    def test_paper_full(self) -> None:
+    def test_paper_full(self, make_source) -> None:
         """Test Paper with all fields populated."""
-        authors = [
-            Author(name="Alice", author_id="A1"),
-            Author(name="Bob", author_id="A2"),
-        ]
         paper = Paper(
             paper_id="openalex:W123",
             doi="10.1234/abc",
             arxiv_id="2401.12345",
             title="Deep Learning for NLP",
             abstract="This paper presents...",
-            authors=authors,
+            authors=list(FULL_AUTHORS),
             year=2024,
             publication_date=date(2024, 1, 15),
             venue="NeurIPS",
             publisher="ACM",
-            fields_of_study=["Computer Science", "AI"],
-            keywords=["NLP", "transformers"],
+            fields_of_study=list(FULL_FIELDS_OF_STUDY),
+            keywords=list(FULL_KEYWORDS),
             citation_count=42,
             influential_citation_count=10,
             reference_count=50,
             is_open_access=True,
             open_access_pdf="https://arxiv.org/pdf/2401.12345.pdf",
-            external_ids={"MAG": "123456", "PubMed": "789"},
-            source=Source(
-                database="openalex",
-                query="NLP",
-                timestamp="2025-11-08T10:00:00Z",
-            ),
+            external_ids=dict(FULL_EXTERNAL_IDS),
+            source=make_source("openalex", "NLP"),
         )
         assert paper.paper_id == "openalex:W123"
         assert paper.doi == "10.1234/abc"
         assert paper.arxiv_id == "2401.12345"
-        assert len(paper.authors) == 2
+        assert [a.name for a in paper.authors] == ["Alice", "Bob"]
         assert paper.year == 2024
         assert paper.citation_count == 42
         assert paper.is_open_access is True
 
-    def test_paper_doi_normalization(self) -> None:
+    def test_paper_doi_normalization(self, default_source: Source) -> None:
         """Test DOI normalization in Paper model validator."""
         paper = Paper(
             paper_id="test:1",
             title="Test",
             doi="https://doi.org/10.1234/ABC",
-            source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+            source=default_source,
         )
         # DOI should be normalized to lowercase without prefix
         assert paper.doi == "10.1234/abc"
 
-    def test_paper_doi_normalization_variants(self) -> None:
+    @pytest.mark.parametrize("input_doi,expected_doi", DOI_NORMALIZATION_CASES)
+    def test_paper_doi_normalization_variants(
+        self, input_doi: str, expected_doi: str, default_source: Source
+    ) -> None:
         """Test various DOI prefix normalizations."""
-        test_cases = [
-            ("https://doi.org/10.1234/ABC", "10.1234/abc"),
-            ("http://dx.doi.org/10.1234/ABC", "10.1234/abc"),
-            ("DOI:10.1234/ABC", "10.1234/abc"),
-            ("10.1234/ABC", "10.1234/abc"),
-        ]
-        for input_doi, expected_doi in test_cases:
-            paper = Paper(
-                paper_id="test:1",
-                title="Test",
-                doi=input_doi,
-                source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
-            )
-            assert paper.doi == expected_doi
+        paper = Paper(
+            paper_id="test:1",
+            title="Test",
+            doi=input_doi,
+            source=default_source,
+        )
+        assert paper.doi == expected_doi
 
-    def test_paper_arxiv_normalization(self) -> None:
+    def test_paper_arxiv_normalization(self, default_source: Source) -> None:
         """Test arXiv ID normalization in Paper model validator."""
         paper = Paper(
             paper_id="test:1",
             title="Test",
             arxiv_id="arxiv:1234.5678",
-            source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+            source=default_source,
         )
         assert paper.arxiv_id == "1234.5678"
 
-    def test_paper_year_validation_valid(self) -> None:
+    def test_paper_year_validation_valid(self, default_source: Source) -> None:
         """Test year validation accepts valid years."""
         paper = Paper(
             paper_id="test:1",
             title="Test",
             year=2024,
-            source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+            source=default_source,
         )
         assert paper.year == 2024
 
-    def test_paper_year_validation_too_early(self) -> None:
-        """Test year validation rejects years before 1900."""
-        with pytest.raises(ValidationError):
-            Paper(
-                paper_id="test:1",
-                title="Test",
-                year=1899,
-                source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
-            )
-
-    def test_paper_year_validation_too_late(self) -> None:
-        """Test year validation rejects years after 2100."""
-        with pytest.raises(ValidationError):
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("year", 1899),
+            ("year", 2101),
+            ("citation_count", -1),
+        ],
+        ids=["year_too_early", "year_too_late", "negative_citation_count"],
+    )
+    def test_paper_field_validation_rejects(
+        self, field: str, value: int, default_source: Source
+    ) -> None:
+        """Test out-of-range year and negative citation count are rejected."""
+        with pytest.raises(ValidationError, match=field):
             Paper(
                 paper_id="test:1",
                 title="Test",
-                year=2101,
-                source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+                source=default_source,
+                **{field: value},
             )
 
-    def test_paper_citation_count_negative(self) -> None:
-        """Test citation count cannot be negative."""
-        with pytest.raises(ValidationError):
-            Paper(
-                paper_id="test:1",
-                title="Test",
-                citation_count=-1,
-                source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
-            )
-
-    def test_paper_serialization(self) -> None:
+    def test_paper_serialization(self, default_source: Source) -> None:
         """Test Paper can be serialized to JSON."""
         paper = Paper(
             paper_id="test:1",
             title="Test Paper",
             doi="10.1234/test",
             year=2024,
-            source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+            source=default_source,
         )
         json_data = paper.model_dump()
         assert json_data["paper_id"] == "test:1"
@@ -227,28 +248,80 @@ class TestPaperModel:
                 "timestamp": "2025-11-08T10:00:00Z",
             },
         }
-        paper = Paper(**data)
+        paper = Paper.model_validate(data)
         assert paper.paper_id == "test:1"
         assert paper.title == "Test Paper"
 
-    def test_paper_model_copy_deep(self) -> None:
+    def test_paper_model_validate_json_bytes(self) -> None:
+        """Test Paper can be validated straight from JSON bytes."""
+        raw = (
+            b'{"paper_id": "test:1", "title": "T", "doi": "DOI:10.1234/ABC",'
+            b' "source": {"database": "test", "query": "test",'
+            b' "timestamp": "2025-11-08T10:00:00Z"}}'
+        )
+        paper = Paper.model_validate_json(raw)
+        assert paper.paper_id == "test:1"
+        assert paper.doi == "10.1234/abc"
+        assert paper.source.database == "test"
+
+    def test_paper_model_dump_json_roundtrip(
+        self, default_source: Source, default_author: Author
+    ) -> None:
+        """Test a Paper survives a JSON dump and validate round trip."""
+        paper = Paper(
+            paper_id="test:1",
+            title="Test Paper",
+            authors=[default_author],
+            publication_date=date(2024, 1, 15),
+            source=default_source,
+        )
+        assert Paper.model_validate_json(paper.model_dump_json()) == paper
+
+    def test_paper_model_copy_isolated_lists(
+        self, default_source: Source, default_author: Author
+    ) -> None:
+        """Test a copy with duplicated lists doesn't share them with the original."""
+        original = Paper(
+            paper_id="test:1",
+            title="Original",
+            authors=[default_author],
+            fields_of_study=["CS"],
+            source=default_source,
+        )
+        copy = original.model_copy(
+            update={
+                "authors": list(original.authors),
+                "fields_of_study": list(original.fields_of_study),
+            }
+        )
+
+        # Modify the copy
+        copy.authors.append(Author(name="Bob"))
+        copy.fields_of_study.append("AI")
+
+        # Original should be unchanged
+        assert original.authors == [default_author]
+        assert original.fields_of_study == ["CS"]
+
+    def test_paper_model_copy_deep(self, default_source: Source) -> None:
         """Test deep copy doesn't share references."""
         original = Paper(
             paper_id="test:1",
             title="Original",
             authors=[Author(name="Alice")],
             fields_of_study=["CS"],
-            source=Source(database="test", query="test", timestamp="2025-11-08T10:00:00Z"),
+            source=default_source,
         )
         copy = original.model_copy(deep=True)
 
-        # Modify the copy
+        # Modify the copy, including a nested author
         copy.authors.append(Author(name="Bob"))
+        copy.authors[0].name = "Carol"
         copy.fields_of_study.append("AI")
 
         # Original should be unchanged
-        assert len(original.authors) == 1
-        assert len(original.fields_of_study) == 1
+        assert original.authors == [Author(name="Alice")]
+        assert original.fields_of_study == ["CS"]
 
 
 class TestReferenceModel:
@@ -292,37 +365,25 @@ class TestDeduplicationClusterModel:
             confidence=1.0,
         )
         assert cluster.canonical_id == "paper:1"
-        assert len(cluster.duplicate_ids) == 2
+        assert cluster.duplicate_ids == ["paper:2", "paper:3"]
         assert cluster.match_type == "doi"
         assert cluster.confidence == 1.0
 
-    def test_cluster_confidence_validation_low(self) -> None:
-        """Test confidence must be >= 0.0."""
-        with pytest.raises(ValidationError):
-            DeduplicationCluster(
-                canonical_id="paper:1",
-                duplicate_ids=["paper:2"],
-                match_type="doi",
-                confidence=-0.1,
-            )
-
-    def test_cluster_confidence_validation_high(self) -> None:
-        """Test confidence must be <= 1.0."""
-        with pytest.raises(ValidationError):
+    @pytest.mark.parametrize("confidence", [-0.1, 1.1], ids=["too_low", "too_high"])
+    def test_cluster_confidence_validation(self, confidence: float) -> None:
+        """Test confidence must be within [0.0, 1.0]."""
+        with pytest.raises(ValidationError, match="confidence"):
             DeduplicationCluster(
                 canonical_id="paper:1",
                 duplicate_ids=["paper:2"],
                 match_type="doi",
-                confidence=1.1,
+                confidence=confidence,
             )
 
     def test_cluster_fuzzy_match(self) -> None:
         """Test cluster with fuzzy matching."""
-        cluster = DeduplicationCluster(
-            canonical_id="paper:1",
-            duplicate_ids=["paper:2"],
-            match_type="title_fuzzy",
-            confidence=0.87,
+        cluster = BASE_CLUSTER.model_copy(
+            update={"match_type": "title_fuzzy", "confidence": 0.87}
         )
         assert cluster.match_type == "title_fuzzy"
         assert 0.85 <= cluster.confidence < 0.9
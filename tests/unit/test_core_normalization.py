@@ -1,8 +1,10 @@
 """Unit tests for text and metadata normalization utilities."""
 
 from datetime import date, datetime
+import re
 import pytest
 
+from srp.core import normalization as _norm
 from srp.core.normalization import (
     normalize_title,
     parse_date,
@@ -11,6 +13,11 @@ from srp.core.normalization import (
 )
 
 
+def test_normalization_regexes_precompiled() -> None:
+    """Test the hot-path pattern is compiled once at module level."""
+    assert isinstance(_norm._PUNCT_RE, re.Pattern)
+
+
 class TestNormalizeTitle:
     """Tests for title normalization."""
 
@@ -24,11 +31,17 @@ class TestNormalizeTitle:
         assert normalize_title("UPPERCASE TITLE") == "uppercase title"
         assert normalize_title("MiXeD CaSe") == "mixed case"
 
-    def test_normalize_title_punctuation_removal(self) -> None:
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            ("Title: A Survey!", "title a survey"),
+            ("What is AI?", "what is ai"),
+            ("Machine-Learning", "machinelearning"),
+        ],
+    )
+    def test_normalize_title_punctuation_removal(self, title: str, expected: str) -> None:
         """Test punctuation is removed."""
-        assert normalize_title("Title: A Survey!") == "title a survey"
-        assert normalize_title("What is AI?") == "what is ai"
-        assert normalize_title("Machine-Learning") == "machinelearning"
+        assert normalize_title(title) == expected
 
     def test_normalize_title_whitespace_normalization(self) -> None:
         """Test multiple spaces become single space."""
@@ -57,10 +70,9 @@ class TestNormalizeTitle:
         assert normalize_title("The Year 2024") == "the year 2024"
 
     def test_normalize_title_unicode(self) -> None:
-        """Test unicode characters handling."""
-        # Depending on implementation, unicode may be kept or removed
-        result = normalize_title("Café: A Study")
-        assert "caf" in result.lower() or "cafe" in result.lower()
+        """Test unicode letters are kept and lowercased."""
+        assert normalize_title("Café: A Study") == "café a study"
+        assert normalize_title("ÜBER Lernen") == "über lernen"
 
 
 class TestParseDate:
@@ -104,11 +116,17 @@ class TestParseDate:
         """Test empty string returns None."""
         assert parse_date("") is None
 
-    def test_parse_date_invalid_format(self) -> None:
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            "not-a-date",
+            "13-13-2024",  # Invalid month
+            "2024-02-30",  # Invalid day
+        ],
+    )
+    def test_parse_date_invalid_format(self, date_str: str) -> None:
         """Test invalid date format returns None."""
-        assert parse_date("not-a-date") is None
-        assert parse_date("13-13-2024") is None  # Invalid month
-        assert parse_date("2024-02-30") is None  # Invalid day
+        assert parse_date(date_str) is None
 
     def test_parse_date_partial_match(self) -> None:
         """Test date parsing with extra characters."""
@@ -116,34 +134,53 @@ class TestParseDate:
         result = parse_date("2024-01-15T10:30:00Z")
         assert result == date(2024, 1, 15)
 
+    def test_parse_date_iso_fast_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test ISO dates are parsed without strptime."""
+        calls = []
+
+        class RecordingDatetime(datetime):
+            @classmethod
+            def strptime(cls, *args):
+                calls.append(args)
+                return datetime.strptime(*args)
+
+        monkeypatch.setattr(_norm, "datetime", RecordingDatetime)
+        assert parse_date("2024-01-15") == date(2024, 1, 15)
+        assert calls == []
+        # Other formats still go through strptime
+        assert parse_date("15/01/2024") == date(2024, 1, 15)
+        assert calls
+
     def test_parse_date_edge_cases(self) -> None:
         """Test edge case dates."""
         assert parse_date("2024-12-31") == date(2024, 12, 31)
         assert parse_date("2000-01-01") == date(2000, 1, 1)
 
 
+LEAP_DAY = date(2024, 2, 29)
+EXTRACT_YEAR_CASES = [
+    (date(2024, 6, 15), 2024),
+    (date(2020, 1, 1), 2020),
+    (date(1999, 12, 31), 1999),
+    (date(2025, 7, 4), 2025),
+    (LEAP_DAY, 2024),
+    (None, None),
+]
+
+
 class TestExtractYear:
     """Tests for year extraction from date."""
 
-    def test_extract_year_valid_date(self) -> None:
-        """Test extracting year from valid date."""
-        d = date(2024, 6, 15)
-        assert extract_year(d) == 2024
-
-    def test_extract_year_different_years(self) -> None:
-        """Test different years."""
-        assert extract_year(date(2020, 1, 1)) == 2020
-        assert extract_year(date(1999, 12, 31)) == 1999
-        assert extract_year(date(2025, 7, 4)) == 2025
+    @pytest.mark.parametrize("d,year", EXTRACT_YEAR_CASES)
+    def test_extract_year(self, d: date | None, year: int | None) -> None:
+        """Test extracting year from a date, including None."""
+        assert extract_year(d) == year
 
-    def test_extract_year_none(self) -> None:
-        """Test None input returns None."""
-        assert extract_year(None) is None
 
-    def test_extract_year_leap_year(self) -> None:
-        """Test year extraction on leap year date."""
-        d = date(2024, 2, 29)
-        assert extract_year(d) == 2024
+@pytest.fixture(scope="module")
+def long_abstract() -> str:
+    """Abstract longer than the default max_length."""
+    return "A" * 6000
 
 
 class TestCleanAbstract:
@@ -163,13 +200,34 @@ class TestCleanAbstract:
         assert "\n" not in result
         assert result == "This is a sample abstract with extra whitespace."
 
-    def test_clean_abstract_truncation(self) -> None:
+    def test_clean_abstract_truncation(self, long_abstract: str) -> None:
         """Test abstract is truncated at max_length."""
-        abstract = "A" * 6000
-        result = clean_abstract(abstract, max_length=5000)
+        result = clean_abstract(long_abstract, max_length=5000)
         assert len(result) <= 5003  # 5000 + "..."
         assert result.endswith("...")
 
+    def test_clean_abstract_truncates_long_input(self, long_abstract: str) -> None:
+        """Test input far beyond max_length is cut to max_length."""
+        result = clean_abstract(long_abstract, max_length=100)
+        assert result == "A" * 100 + "..."
+
+    @pytest.mark.parametrize(
+        "abstract",
+        [
+            "A" + " " * 300 + "B" * 200,  # Whitespace run longer than the window
+            "word " * 100,
+            "A" * 100 + " " * 500,  # Only whitespace past max_length
+            "x" * 99 + " " + "y" * 300,  # Window ends inside a word
+            " " * 150 + "z" * 50,  # Fits after collapsing; no truncation
+            "a\x1cb\u3000c " * 60,  # Control and non-ASCII whitespace
+        ],
+    )
+    def test_clean_abstract_matches_full_cleaning(self, abstract: str) -> None:
+        """Test cleaning a window gives the same result as cleaning everything."""
+        cleaned = " ".join(abstract.split())
+        expected = cleaned[:100] + "..." if len(cleaned) > 100 else cleaned
+        assert clean_abstract(abstract, max_length=100) == expected
+
     def test_clean_abstract_no_truncation_needed(self) -> None:
         """Test abstract shorter than max_length is not truncated."""
         abstract = "Short abstract."
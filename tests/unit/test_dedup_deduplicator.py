@@ -1,10 +1,15 @@
 """Comprehensive unit tests for deduplication logic."""
 
 from datetime import date
+import random
+import string
+
 import pytest
+from rapidfuzz.distance import Indel
 
 from srp.core.models import Paper, Source, Author
-from srp.dedup.deduplicator import Deduplicator
+from srp.dedup import deduplicator
+from srp.dedup.deduplicator import Deduplicator, _cdist_pairs, _max_similarity
 
 
 def make_paper(
@@ -96,6 +101,30 @@ class TestDeduplicatorDOIMatching:
         
         assert len(deduped) == 1
         assert deduped[0].citation_count == 10
+        assert clusters[0].canonical_id == "p2"
+
+    def test_deduplicate_doi_max_citations_chosen_while_bucketing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test DOI clusters under most_citations need no separate scoring pass."""
+        papers = [
+            make_paper("p1", doi="10.1234/abc", citation_count=5),
+            make_paper("p2", doi="10.1234/abc", citation_count=10),
+            make_paper("p3", doi="10.1234/abc", citation_count=10),
+        ]
+        dedup = Deduplicator(merge_strategy="most_citations")
+        scored = []
+        original = dedup._canonical_scores
+
+        def recording(papers, indices):
+            scored.extend(indices.tolist())
+            return original(papers, indices)
+
+        monkeypatch.setattr(dedup, "_canonical_scores", recording)
+        deduped, clusters = dedup.deduplicate(papers)
+
+        assert scored == []
+        assert deduped[0].paper_id == "p2"  # First of the tied papers
 
 
 class TestDeduplicatorArxivMatching:
@@ -125,6 +154,7 @@ class TestDeduplicatorArxivMatching:
         # Should deduplicate since versions normalize to same ID
         assert len(deduped) == 1
         assert len(clusters) == 1
+        assert clusters[0].match_type == "arxiv"
 
     def test_deduplicate_doi_takes_precedence_over_arxiv(self) -> None:
         """Test DOI matching happens before arXiv matching."""
@@ -237,6 +267,170 @@ class TestDeduplicatorFuzzyTitleMatching:
         assert len(deduped) == 2
         assert len(clusters) == 2
 
+    def test_deduplicate_fuzzy_chain_forms_one_cluster(self) -> None:
+        """Test titles linked through an intermediate match share a cluster."""
+        base = "Graph Neural Networks for Molecules"
+        papers = [
+            make_paper("p1", title=base, year=2024),
+            make_paper("p2", title=f"{base} Survey", year=2024),
+            make_paper("p3", title=f"{base} Survey Part Two", year=2024),  # Only close to p2
+        ]
+
+        dedup = Deduplicator(fuzzy_threshold=0.85)
+        deduped, clusters = dedup.deduplicate(papers)
+
+        assert len(deduped) == 1
+        assert len(clusters) == 1
+        assert {clusters[0].canonical_id, *clusters[0].duplicate_ids} == {"p1", "p2", "p3"}
+        assert clusters[0].confidence >= 0.85
+
+    def test_deduplicate_fuzzy_many_titles(self) -> None:
+        """Test a large same-year block finds exactly the planted duplicates."""
+        rng = random.Random(0)
+        # All titles share the blocking word "analysis", so the 1000 papers
+        # form one block that is scored in full
+        suffixes = ["".join(rng.choices(string.ascii_lowercase, k=20)) for _ in range(1000)]
+        papers = [
+            make_paper(f"p{i}", title=f"Analysis of {suffix}", year=2024)
+            for i, suffix in enumerate(suffixes)
+        ]
+        # One-letter typos, so duplicates need scoring rather than an exact key
+        papers += [
+            make_paper(f"d{i}", title=f"Analysis of {suffixes[i][:-1]}z", year=2024)
+            for i in range(0, 1000, 100)
+        ]
+
+        dedup = Deduplicator(fuzzy_threshold=0.85)
+        deduped, clusters = dedup.deduplicate(papers)
+
+        assert len(deduped) == 1000
+        assert len(clusters) == 10
+        assert all(c.match_type == "title_fuzzy" for c in clusters)
+        assert all(c.confidence < 1.0 for c in clusters)
+
+    @pytest.mark.parametrize(
+        "title1,title2",
+        [
+            (
+                "A Survey of Graph Neural Networks for Drug Discovery",
+                "The Survey of Graph Neural Networks for Drug Discovery",
+            ),
+            ("Towards Robust Deep Learning Models", "Toward Robust Deep Learning Models"),
+            ("On the Theory of Deep Learning", "The Theory of Deep Learning"),
+        ],
+    )
+    def test_deduplicate_fuzzy_ignores_leading_stopwords(self, title1: str, title2: str) -> None:
+        """Test titles differing only in a leading article/preposition still match."""
+        papers = [make_paper("p1", title=title1), make_paper("p2", title=title2)]
+
+        deduped, clusters = Deduplicator().deduplicate(papers)
+
+        assert len(deduped) == 1
+        assert clusters[0].match_type == "title_fuzzy"
+
+    def test_deduplicate_fuzzy_stopword_only_titles(self) -> None:
+        """Test titles made only of stopwords still block on their first word."""
+        papers = [make_paper("p1", title="On the"), make_paper("p2", title="On The.")]
+
+        deduped, clusters = Deduplicator().deduplicate(papers)
+
+        assert len(deduped) == 1
+
+    def test_deduplicate_identical_titles_skip_scoring(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test identical normalized titles cluster without a similarity call."""
+        papers = [
+            make_paper("p1", title="Graph Neural Networks", year=2024),
+            make_paper("p2", title="graph neural networks.", year=2024),
+            make_paper("p3", title="GRAPH NEURAL NETWORKS", year=2024),
+        ]
+        dedup = Deduplicator()
+        monkeypatch.setattr(
+            dedup, "_title_similarity", lambda a, b: pytest.fail("unexpected similarity call")
+        )
+
+        deduped, clusters = dedup.deduplicate(papers)
+
+        assert len(deduped) == 1
+        assert len(clusters) == 1
+        assert clusters[0].match_type == "title_fuzzy"
+        assert clusters[0].confidence == 1.0
+
+    def test_deduplicate_fuzzy_large_block_matches_pairwise(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a block scored with cdist clusters like the pairwise loop."""
+        papers = [
+            make_paper(f"p{i}", title=f"Learning {i % 7} to rank model {i}", year=2024)
+            for i in range(60)
+        ]
+
+        _, cdist_clusters = Deduplicator().deduplicate(papers)
+        monkeypatch.setattr(deduplicator, "_CDIST_MIN_BLOCK", 10**9)
+        _, loop_clusters = Deduplicator().deduplicate(papers)
+
+        assert cdist_clusters
+        assert [c.model_dump() for c in cdist_clusters] == [c.model_dump() for c in loop_clusters]
+
+    @pytest.mark.parametrize("max_cells", [1, 7, 60, 61, 1000])
+    def test_cdist_pairs_row_chunks_match_full_matrix(self, max_cells: int) -> None:
+        """Test scoring a block in row chunks finds the same pairs in order."""
+        titles = [f"learning {i % 7} to rank model {i}" for i in range(60)]
+
+        full = _cdist_pairs(titles, 0.85, max_cells=len(titles) ** 2)
+
+        assert full
+        assert _cdist_pairs(titles, 0.85, max_cells=max_cells) == full
+
+    def test_deduplicate_fuzzy_several_large_blocks(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test large blocks scored on worker threads cluster like the loop."""
+        papers = [
+            make_paper(f"p{i}", title=f"{word} {i % 5} study of model {i}", year=2024)
+            for word in ("learning", "mining", "ranking")
+            for i in range(40)
+        ]
+
+        _, threaded_clusters = Deduplicator().deduplicate(papers)
+        monkeypatch.setattr(deduplicator, "_CDIST_MIN_BLOCK", 10**9)
+        _, loop_clusters = Deduplicator().deduplicate(papers)
+
+        assert {c.match_type for c in threaded_clusters} == {"title_fuzzy"}
+        assert sorted(c.model_dump_json() for c in threaded_clusters) == sorted(
+            c.model_dump_json() for c in loop_clusters
+        )
+
+    def test_score_blocks_share_cell_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test concurrent blocks split one score-memory budget between threads."""
+        budgets = []
+
+        def record(titles, threshold, workers=-1, max_cells=deduplicator._CDIST_MAX_CELLS):
+            budgets.append(max_cells)
+            return []
+
+        monkeypatch.setattr(deduplicator, "_cdist_pairs", record)
+        monkeypatch.setattr(deduplicator.os, "cpu_count", lambda: 4)
+
+        deduplicator._score_blocks([["a"], ["b"], ["c"]], 0.85)
+
+        assert budgets == [deduplicator._CDIST_MAX_CELLS // 3] * 3
+        assert sum(budgets) <= deduplicator._CDIST_MAX_CELLS
+
+    @pytest.mark.parametrize(
+        "a,b",
+        [
+            ("deep learning", "deep learning for nlp"),
+            ("graph neural networks", "graph networks"),
+            ("a", "abcdefghij"),
+            ("survey", "survey"),
+        ],
+    )
+    def test_length_bound_never_below_similarity(self, a: str, b: str) -> None:
+        """Test the length prefilter bound never rejects a real match."""
+        assert _max_similarity(len(a), len(b)) >= Indel.normalized_similarity(a, b)
+
 
 class TestDeduplicatorMergeStrategy:
     """Tests for canonical selection and merging."""
@@ -277,6 +471,40 @@ class TestDeduplicatorMergeStrategy:
         # p2 should be canonical due to better completeness
         assert deduped[0].paper_id == "p2"
 
+    def test_completeness_scored_once_per_clustered_paper(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test only clustered papers are scored, each exactly once."""
+        papers = [
+            make_paper("p1", doi="10.1234/abc"),
+            make_paper("p2", doi="10.1234/abc"),
+            make_paper("p3", doi="10.1234/xyz", title="Unrelated paper"),
+        ]
+        dedup = Deduplicator(merge_strategy="best_completeness")
+        scored = []
+        original = dedup._compute_completeness_score
+
+        def recording(paper: Paper) -> float:
+            scored.append(paper.paper_id)
+            return original(paper)
+
+        monkeypatch.setattr(dedup, "_compute_completeness_score", recording)
+        dedup.deduplicate(papers)
+
+        assert sorted(scored) == ["p1", "p2"]
+
+    @pytest.mark.parametrize("strategy", ["most_citations", "best_completeness", "first"])
+    def test_merge_strategy_ties_keep_first(self, strategy: str) -> None:
+        """Test tied papers resolve to the earliest cluster member."""
+        papers = [
+            make_paper("p1", doi="10.1234/abc", citation_count=7),
+            make_paper("p2", doi="10.1234/abc", citation_count=7),
+        ]
+
+        deduped, _ = Deduplicator(merge_strategy=strategy).deduplicate(papers)
+
+        assert deduped[0].paper_id == "p1"
+
     def test_merge_paper_data_fields_of_study(self) -> None:
         """Test merging combines fields of study."""
         papers = [
@@ -436,6 +664,7 @@ class TestDeduplicatorEdgeCases:
         assert len(deduped) == 1
         assert len(clusters) == 0
         assert deduped[0].paper_id == "p1"
+        assert dedup.get_canonical_id("p1") == "p1"
 
     def test_deduplicate_no_duplicates(self) -> None:
         """Test deduplication with no duplicates."""
@@ -1,5 +1,6 @@
 """Unit tests for QueryBuilder systematic query generation."""
 
+from itertools import combinations
 import pytest
 from pathlib import Path
 
@@ -52,6 +53,19 @@ class TestQueryBuilderCorePairs:
         # C(5,2) = 10 pairs
         assert len(pairs) == 10
 
+    def test_generate_core_pairs_combinations_order(self) -> None:
+        """Test pairs come out in itertools.combinations order."""
+        builder = QueryBuilder()
+        terms = [f"t{i}" for i in range(12)]
+
+        pairs = builder.generate_core_pairs(terms)
+
+        assert pairs == [f"{a} {b}" for a, b in combinations(terms, 2)]
+
+    def test_generate_core_pairs_empty(self) -> None:
+        """Test no terms gives no pairs."""
+        assert QueryBuilder().generate_core_pairs([]) == []
+
 
 class TestQueryBuilderAugmentation:
     """Tests for query augmentation."""
@@ -248,6 +262,17 @@ class TestQueryBuilderSaveQueries:
         assert "`machine learning`" in content
         assert "`deep learning`" in content
 
+    def test_save_queries_exact_layout(self, tmp_path: Path) -> None:
+        """Test the saved file layout is numbered markdown."""
+        builder = QueryBuilder()
+        output_path = tmp_path / "queries.md"
+
+        builder.save_queries(["a b", "c d"], output_path)
+
+        assert output_path.read_text(encoding="utf-8") == (
+            "# Generated Search Queries\n\nTotal queries: 2\n\n1. `a b`\n2. `c d`\n"
+        )
+
     def test_save_queries_empty_list(self, tmp_path: Path) -> None:
         """Test saving empty query list."""
         builder = QueryBuilder()
@@ -299,3 +324,11 @@ max_terms_per_query: 3
         assert builder.config is not None
         assert "boolean_operators" in builder.config
 
+
+    def test_query_builder_default_config_shared_read_only(self) -> None:
+        """Test builders share one default config that can't be mutated."""
+        first, second = QueryBuilder(), QueryBuilder()
+
+        assert first.config is second.config
+        with pytest.raises(TypeError):
+            first.config["max_terms_per_query"] = 10